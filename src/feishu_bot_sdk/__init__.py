@@ -68,6 +68,7 @@ from .exceptions import (
     FeishuError,
     HTTPRequestError,
     SDKError,
+    TaskTimeoutError,
 )
 from .events import (
     AudioMessageContent,
@@ -104,6 +105,7 @@ from .events import (
     build_idempotency_key,
     extract_text_from_parsed_message,
     parse_received_message_content,
+    parse_received_message_content_batch,
     parse_event_envelope,
 )
 from .feishu import AsyncFeishuClient, FeishuClient, OAuthUserInfo, OAuthUserToken
@@ -308,6 +310,7 @@ __all__ = [
     "StickerMessageContent",
     "Struct",
     "SystemMessageContent",
+    "TaskTimeoutError",
     "TextMessageContent",
     "UnknownMessageContent",
     "FeishuBotServer",
@@ -326,5 +329,6 @@ __all__ = [
     "fetch_ws_endpoint",
     "fetch_ws_endpoint_async",
     "parse_received_message_content",
+    "parse_received_message_content_batch",
     "parse_event_envelope",
 ]
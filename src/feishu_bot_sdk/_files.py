@@ -0,0 +1,13 @@
+import functools
+import mimetypes
+from typing import Optional
+
+
+@functools.lru_cache(maxsize=512)
+def guess_mime_type(filename: str) -> Optional[str]:
+    return mimetypes.guess_type(filename)[0]
+
+
+def read_file_bytes(file_path: str) -> bytes:
+    with open(file_path, "rb") as file_obj:
+        return file_obj.read()
@@ -0,0 +1,25 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def json_loads(data: Union[bytes, bytearray, str]) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep catching ValueError.
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_bytes(value: Any) -> bytes:
+    # orjson emits compact UTF-8 directly; it rejects a few inputs (e.g. ints beyond 64 bits)
+    # that the stdlib still accepts, so those fall back instead of failing the response.
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
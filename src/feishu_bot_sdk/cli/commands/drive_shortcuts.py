@@ -10,7 +10,7 @@ from urllib.parse import quote
 
 import httpx
 
-from ...exceptions import HTTPRequestError
+from ...exceptions import HTTPRequestError, TaskTimeoutError
 from ...docx import DocContentService
 from ...drive import DriveFileService
 from ..runtime import _build_client, infer_mime_type
@@ -153,26 +153,29 @@ def _normalize_task_check_status(task_id: str, payload: Mapping[str, Any]) -> di
     }
 
 
+def _task_wait_options(attempts: int, interval_seconds: float) -> dict[str, Any]:
+    # --poll-attempts caps the number of polls and --poll-interval spaces them evenly, with no wall-clock timeout.
+    interval = max(interval_seconds, 0.0)
+    return {
+        "poll_interval": interval,
+        "max_poll_interval": interval,
+        "timeout_seconds": float("inf"),
+        "max_attempts": max(attempts, 1),
+    }
+
+
+def _mark_task_readiness(status: dict[str, Any], *, token_key: str) -> dict[str, Any]:
+    status["ready"] = bool(status.get(token_key))
+    status["failed"] = not status["ready"] and status["job_status"] not in {0, 1, 2}
+    return status
+
+
 def _poll_import_result(drive: DriveFileService, ticket: str, *, attempts: int, interval_seconds: float) -> dict[str, Any]:
-    last = _normalize_import_status(ticket, drive.get_import_task(ticket))
-    if last.get("token"):
-        last["ready"] = True
-        last["failed"] = False
-        return last
-    for _ in range(max(attempts - 1, 0)):
-        time.sleep(max(interval_seconds, 0.0))
-        last = _normalize_import_status(ticket, drive.get_import_task(ticket))
-        if last.get("token"):
-            last["ready"] = True
-            last["failed"] = False
-            return last
-        if last["job_status"] not in {0, 1, 2}:
-            last["ready"] = False
-            last["failed"] = True
-            return last
-    last["ready"] = False
-    last["failed"] = last["job_status"] not in {0, 1, 2}
-    return last
+    try:
+        payload = drive.wait_import_task(ticket, **_task_wait_options(attempts, interval_seconds))
+    except TaskTimeoutError as exc:
+        payload = exc.last_payload or {}
+    return _mark_task_readiness(_normalize_import_status(ticket, payload), token_key="token")
 
 
 def _poll_export_result(
@@ -183,25 +186,15 @@ def _poll_export_result(
     attempts: int,
     interval_seconds: float,
 ) -> dict[str, Any]:
-    last = _normalize_export_status(ticket, drive.get_export_task(ticket, token=source_token))
-    if last.get("file_token"):
-        last["ready"] = True
-        last["failed"] = False
-        return last
-    for _ in range(max(attempts - 1, 0)):
-        time.sleep(max(interval_seconds, 0.0))
-        last = _normalize_export_status(ticket, drive.get_export_task(ticket, token=source_token))
-        if last.get("file_token"):
-            last["ready"] = True
-            last["failed"] = False
-            return last
-        if last["job_status"] not in {0, 1, 2}:
-            last["ready"] = False
-            last["failed"] = True
-            return last
-    last["ready"] = False
-    last["failed"] = last["job_status"] not in {0, 1, 2}
-    return last
+    try:
+        payload = drive.wait_export_task(
+            ticket,
+            token=source_token,
+            **_task_wait_options(attempts, interval_seconds),
+        )
+    except TaskTimeoutError as exc:
+        payload = exc.last_payload or {}
+    return _mark_task_readiness(_normalize_export_status(ticket, payload), token_key="file_token")
 
 
 def _poll_task_check_result(
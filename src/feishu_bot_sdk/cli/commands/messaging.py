@@ -137,43 +137,51 @@ def _cmd_im_update_url_previews(args: argparse.Namespace) -> Any:
 
 def _cmd_media_upload_image(args: argparse.Namespace) -> Mapping[str, Any]:
     service = MediaService(_build_client(args))
-    return service.upload_image(str(args.path), image_type=str(args.image_type))
+    try:
+        return service.upload_image(str(args.path), image_type=str(args.image_type))
+    finally:
+        service.close()
 
 
 def _cmd_media_upload_file(args: argparse.Namespace) -> Mapping[str, Any]:
     service = MediaService(_build_client(args))
-    return service.upload_file(
-        str(args.path),
-        file_type=str(args.file_type),
-        file_name=getattr(args, "file_name", None),
-        duration=getattr(args, "duration", None),
-        content_type=getattr(args, "content_type", None),
-    )
+    try:
+        return service.upload_file(
+            str(args.path),
+            file_type=str(args.file_type),
+            file_name=getattr(args, "file_name", None),
+            duration=getattr(args, "duration", None),
+            content_type=getattr(args, "content_type", None),
+        )
+    finally:
+        service.close()
 
 
 def _cmd_media_download_file(args: argparse.Namespace) -> Mapping[str, Any]:
-    service = MediaService(_build_client(args))
     file_key = str(args.file_key)
     message_id = getattr(args, "message_id", None)
     resource_type = getattr(args, "resource_type", None)
     mode = "file"
+    if not message_id and resource_type:
+        raise ValueError("--resource-type requires --message-id")
 
-    if message_id:
-        resolved_resource_type = str(resource_type or ("image" if file_key.startswith("img_") else "file"))
-        content = service.download_message_resource(
-            str(message_id),
-            file_key,
-            resource_type=resolved_resource_type,
-        )
-        mode = "message_resource"
-    else:
-        if resource_type:
-            raise ValueError("--resource-type requires --message-id")
-        if file_key.startswith("img_"):
+    service = MediaService(_build_client(args))
+    try:
+        if message_id:
+            resolved_resource_type = str(resource_type or ("image" if file_key.startswith("img_") else "file"))
+            content = service.download_message_resource(
+                str(message_id),
+                file_key,
+                resource_type=resolved_resource_type,
+            )
+            mode = "message_resource"
+        elif file_key.startswith("img_"):
             content = service.download_image(file_key)
             mode = "image"
         else:
             content = service.download_file(file_key)
+    finally:
+        service.close()
 
     output_path = Path(str(args.output))
     if output_path.parent and not output_path.parent.exists():
@@ -2,13 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
 import sys
 import threading
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Any, Mapping
 
+from ..._json import json_dumps_bytes
 from ...events import EventContext, FeishuEventRegistry
 from ...webhook import WebhookReceiver
 from ...ws import AsyncLongConnectionClient
@@ -69,7 +69,7 @@ def _serve_webhook_http(
             return
 
         def _send_json(self, status_code: int, payload: Mapping[str, Any]) -> None:
-            body = json.dumps(_to_jsonable(payload), ensure_ascii=False).encode("utf-8")
+            body = json_dumps_bytes(_to_jsonable(payload))
             self.send_response(status_code)
             self.send_header("Content-Type", "application/json; charset=utf-8")
             self.send_header("Content-Length", str(len(body)))
@@ -22,6 +22,10 @@ class FeishuConfig:
     doc_folder_token: Optional[str] = None
     member_permission: str = "edit"
     timeout_seconds: float = 30.0
+    http2_enabled: bool = True
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry_seconds: float = 60.0
     rate_limit_enabled: bool = True
     rate_limit_base_qps: float = 5.0
     rate_limit_min_qps: float = 1.0
@@ -1,9 +1,15 @@
+import threading
+import time
+from collections import OrderedDict
 from typing import Any, Iterator, Mapping, Optional
 
 from ..response import DataResponse
 
 
-def _drop_none(params: Mapping[str, object]) -> dict[str, object]:
+def _drop_none(params: dict[str, object]) -> dict[str, object]:
+    # Callers pass freshly built literals, so the input can be returned as-is when nothing is dropped.
+    if None not in params.values():
+        return params
     return {key: value for key, value in params.items() if value is not None}
 
 
@@ -29,3 +35,50 @@ def _iter_page_files(data: Mapping[str, Any]) -> Iterator[Mapping[str, Any]]:
     for item in files:
         if isinstance(item, Mapping):
             yield item
+
+
+def _is_task_finished(data: Mapping[str, Any], *, token_key: str) -> bool:
+    result = data.get("result")
+    if not isinstance(result, Mapping):
+        return False
+    if result.get(token_key):
+        return True
+    job_status = result.get("job_status")
+    if not isinstance(job_status, int) or job_status in (0, 1, 2):
+        return False
+    return True
+
+
+class _ResponseCache:
+    def __init__(self, *, maxsize: int = 1024) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, Mapping[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Any, ...]) -> Optional[Mapping[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: tuple[Any, ...], value: Mapping[str, Any], *, ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, token: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == token]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
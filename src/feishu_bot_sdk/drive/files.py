@@ -1,21 +1,34 @@
+import asyncio
 import hashlib
-import mimetypes
+import inspect
 import os
-from typing import Any, Iterator, AsyncIterator, Mapping, Optional, Sequence
+import time
+from typing import Any, Awaitable, Callable, Iterator, AsyncIterator, Mapping, Optional, Sequence, Union
 
 import httpx
 
-from ..exceptions import FeishuError, HTTPRequestError
+from .._files import guess_mime_type, read_file_bytes
+from .._json import json_loads
+from ..exceptions import FeishuError, HTTPRequestError, TaskTimeoutError
 from ..feishu import AsyncFeishuClient, FeishuClient
-from ._common import _drop_none, _has_more, _iter_page_files, _next_page_token, _unwrap_data
+from ._common import (
+    _drop_none,
+    _has_more,
+    _is_task_finished,
+    _iter_page_files,
+    _next_page_token,
+    _unwrap_data,
+)
+
+_BytesLike = Union[bytes, bytearray, memoryview]
 
 
 def _build_file_part(
     filename: str,
-    content: bytes,
+    content: _BytesLike,
     content_type: Optional[str],
-) -> tuple[str, bytes, str]:
-    guessed = content_type or mimetypes.guess_type(filename)[0]
+) -> tuple[str, _BytesLike, str]:
+    guessed = content_type or guess_mime_type(filename)
     return (filename, content, guessed or "application/octet-stream")
 
 
@@ -23,8 +36,60 @@ def _content_sha1(content: bytes) -> str:
     return hashlib.sha1(content).hexdigest()
 
 
-def _stringify_form_data(form_data: Mapping[str, object]) -> dict[str, str]:
-    return {key: str(value) for key, value in form_data.items()}
+_MULTIPART_CHUNK_SIZE = 64 * 1024
+_FORM_PARAM_ESCAPES = {0x22: "%22", 0x5C: "\\\\", **{c: f"%{c:02X}" for c in range(0x20) if c != 0x1B}}
+
+
+class _MultipartBody:
+    """multipart/form-data body streamed straight from the caller's buffers."""
+
+    def __init__(
+        self,
+        form_data: Mapping[str, str],
+        files: Mapping[str, tuple[str, _BytesLike, str]],
+    ) -> None:
+        boundary = os.urandom(16).hex()
+        chunks: list[Union[bytes, memoryview]] = []
+        for name, value in form_data.items():
+            chunks.append(
+                f"--{boundary}\r\nContent-Disposition: form-data; {_form_param('name', name)}\r\n\r\n".encode()
+                + value.encode()
+                + b"\r\n"
+            )
+        for name, (filename, content, content_type) in files.items():
+            chunks.append(
+                (
+                    f"--{boundary}\r\nContent-Disposition: form-data; {_form_param('name', name)}; "
+                    f"{_form_param('filename', filename)}\r\nContent-Type: {content_type}\r\n\r\n"
+                ).encode()
+            )
+            view = memoryview(content).cast("B")
+            chunks.extend(
+                view[offset : offset + _MULTIPART_CHUNK_SIZE]
+                for offset in range(0, len(view), _MULTIPART_CHUNK_SIZE)
+            )
+            chunks.append(b"\r\n")
+        chunks.append(f"--{boundary}--\r\n".encode())
+        self._chunks = chunks
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self.content_length = sum(len(chunk) for chunk in chunks)
+
+    def __iter__(self) -> Iterator[Union[bytes, memoryview]]:
+        return iter(self._chunks)
+
+    async def aiter(self) -> AsyncIterator[Union[bytes, memoryview]]:
+        for chunk in self._chunks:
+            yield chunk
+
+
+def _form_param(name: str, value: str) -> str:
+    return f'{name}="{value.translate(_FORM_PARAM_ESCAPES)}"'
+
+
+def _stringify_form_data(form_data: Mapping[str, object]) -> Mapping[str, str]:
+    if all(isinstance(value, str) for value in form_data.values()):
+        return form_data  # type: ignore[return-value]
+    return {key: value if isinstance(value, str) else str(value) for key, value in form_data.items()}
 
 
 def _join_file_tokens(file_tokens: Sequence[str]) -> str:
@@ -126,7 +191,7 @@ class DriveFileService:
         *,
         upload_id: str,
         seq: int,
-        content: bytes,
+        content: _BytesLike,
         checksum: Optional[str] = None,
         filename: str = "part.bin",
         content_type: Optional[str] = None,
@@ -370,6 +435,47 @@ class DriveFileService:
         )
         return _unwrap_data(response)
 
+    def wait_import_task(
+        self,
+        ticket: str,
+        *,
+        poll_interval: float = 0.2,
+        max_poll_interval: float = 5.0,
+        timeout_seconds: float = 300.0,
+        max_attempts: Optional[int] = None,
+        on_complete: Optional[Callable[[Mapping[str, Any]], None]] = None,
+    ) -> Mapping[str, Any]:
+        return self._wait_task(
+            lambda: self.get_import_task(ticket),
+            token_key="token",
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+            timeout_seconds=timeout_seconds,
+            max_attempts=max_attempts,
+            on_complete=on_complete,
+        )
+
+    def wait_export_task(
+        self,
+        ticket: str,
+        *,
+        token: Optional[str] = None,
+        poll_interval: float = 0.2,
+        max_poll_interval: float = 5.0,
+        timeout_seconds: float = 300.0,
+        max_attempts: Optional[int] = None,
+        on_complete: Optional[Callable[[Mapping[str, Any]], None]] = None,
+    ) -> Mapping[str, Any]:
+        return self._wait_task(
+            lambda: self.get_export_task(ticket, token=token),
+            token_key="file_token",
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+            timeout_seconds=timeout_seconds,
+            max_attempts=max_attempts,
+            on_complete=on_complete,
+        )
+
     def get_task_status(self, task_id: str) -> Mapping[str, Any]:
         response = self._client.request_json(
             "GET",
@@ -462,7 +568,7 @@ class DriveFileService:
         *,
         upload_id: str,
         seq: int,
-        content: bytes,
+        content: _BytesLike,
         checksum: Optional[str] = None,
         filename: str = "part.bin",
         content_type: Optional[str] = None,
@@ -574,6 +680,34 @@ class DriveFileService:
         )
         return _unwrap_data(response)
 
+    def _wait_task(
+        self,
+        fetch: Callable[[], Mapping[str, Any]],
+        *,
+        token_key: str,
+        poll_interval: float,
+        max_poll_interval: float,
+        timeout_seconds: float,
+        max_attempts: Optional[int],
+        on_complete: Optional[Callable[[Mapping[str, Any]], None]],
+    ) -> Mapping[str, Any]:
+        deadline = time.monotonic() + timeout_seconds
+        delay = max(poll_interval, 0.0)
+        attempts = 0
+        while True:
+            data = fetch()
+            attempts += 1
+            if _is_task_finished(data, token_key=token_key):
+                if on_complete is not None:
+                    on_complete(data)
+                return data
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or (max_attempts is not None and attempts >= max_attempts):
+                raise TaskTimeoutError(f"drive task not finished after {attempts} polls", last_payload=data)
+            # The last sleep is clipped to the deadline so one final poll happens right at it.
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 1.5, max_poll_interval)
+
     def _request_json_raw(
         self,
         method: str,
@@ -591,7 +725,7 @@ class DriveFileService:
             params=params,
         )
         try:
-            payload = response.json()
+            payload = json_loads(response.content)
         except ValueError as exc:
             raise HTTPRequestError("response body is not valid json") from exc
         if not isinstance(payload, Mapping):
@@ -621,16 +755,17 @@ class DriveFileService:
     ) -> httpx.Response:
         token = self._client.get_access_token()
         headers = {"Authorization": f"Bearer {token}"}
-        url = f"{self._client.config.base_url}{path}"
+        url = self._client.config.base_url + path
+        request_kwargs: dict[str, Any] = {"headers": headers, "params": params or {}}
+        if files:
+            body = _MultipartBody(_stringify_form_data(form_data or {}), files)
+            headers["Content-Type"] = body.content_type
+            headers["Content-Length"] = str(body.content_length)
+            request_kwargs["content"] = body
+        else:
+            request_kwargs["data"] = _stringify_form_data(form_data or {})
         with httpx.Client(timeout=self._client.config.timeout_seconds) as client:
-            response = client.request(
-                method.upper(),
-                url,
-                headers=headers,
-                params=dict(params or {}),
-                data=_stringify_form_data(form_data or {}),
-                files=files,
-            )
+            response = client.request(method.upper(), url, **request_kwargs)
         if response.status_code >= 400:
             raise HTTPRequestError(
                 f"http request failed: {response.status_code}",
@@ -675,15 +810,15 @@ class AsyncDriveFileService:
         content_type: Optional[str] = None,
     ) -> Mapping[str, Any]:
         final_name = file_name or os.path.basename(file_path)
-        with open(file_path, "rb") as file_obj:
-            return await self.upload_file_bytes(
-                final_name,
-                file_obj.read(),
-                parent_type=parent_type,
-                parent_node=parent_node,
-                checksum=checksum,
-                content_type=content_type,
-            )
+        content = await asyncio.to_thread(read_file_bytes, file_path)
+        return await self.upload_file_bytes(
+            final_name,
+            content,
+            parent_type=parent_type,
+            parent_node=parent_node,
+            checksum=checksum,
+            content_type=content_type,
+        )
 
     async def upload_file_bytes(
         self,
@@ -736,7 +871,7 @@ class AsyncDriveFileService:
         *,
         upload_id: str,
         seq: int,
-        content: bytes,
+        content: _BytesLike,
         checksum: Optional[str] = None,
         filename: str = "part.bin",
         content_type: Optional[str] = None,
@@ -980,6 +1115,47 @@ class AsyncDriveFileService:
         )
         return _unwrap_data(response)
 
+    async def wait_import_task(
+        self,
+        ticket: str,
+        *,
+        poll_interval: float = 0.2,
+        max_poll_interval: float = 5.0,
+        timeout_seconds: float = 300.0,
+        max_attempts: Optional[int] = None,
+        on_complete: Optional[Callable[[Mapping[str, Any]], Union[None, Awaitable[None]]]] = None,
+    ) -> Mapping[str, Any]:
+        return await self._wait_task(
+            lambda: self.get_import_task(ticket),
+            token_key="token",
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+            timeout_seconds=timeout_seconds,
+            max_attempts=max_attempts,
+            on_complete=on_complete,
+        )
+
+    async def wait_export_task(
+        self,
+        ticket: str,
+        *,
+        token: Optional[str] = None,
+        poll_interval: float = 0.2,
+        max_poll_interval: float = 5.0,
+        timeout_seconds: float = 300.0,
+        max_attempts: Optional[int] = None,
+        on_complete: Optional[Callable[[Mapping[str, Any]], Union[None, Awaitable[None]]]] = None,
+    ) -> Mapping[str, Any]:
+        return await self._wait_task(
+            lambda: self.get_export_task(ticket, token=token),
+            token_key="file_token",
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+            timeout_seconds=timeout_seconds,
+            max_attempts=max_attempts,
+            on_complete=on_complete,
+        )
+
     async def get_task_status(self, task_id: str) -> Mapping[str, Any]:
         response = await self._client.request_json(
             "GET",
@@ -1003,16 +1179,16 @@ class AsyncDriveFileService:
         content_type: Optional[str] = None,
     ) -> Mapping[str, Any]:
         final_name = file_name or os.path.basename(file_path)
-        with open(file_path, "rb") as file_obj:
-            return await self.upload_media_bytes(
-                final_name,
-                file_obj.read(),
-                parent_type=parent_type,
-                parent_node=parent_node,
-                extra=extra,
-                checksum=checksum,
-                content_type=content_type,
-            )
+        content = await asyncio.to_thread(read_file_bytes, file_path)
+        return await self.upload_media_bytes(
+            final_name,
+            content,
+            parent_type=parent_type,
+            parent_node=parent_node,
+            extra=extra,
+            checksum=checksum,
+            content_type=content_type,
+        )
 
     async def upload_media_bytes(
         self,
@@ -1072,7 +1248,7 @@ class AsyncDriveFileService:
         *,
         upload_id: str,
         seq: int,
-        content: bytes,
+        content: _BytesLike,
         checksum: Optional[str] = None,
         filename: str = "part.bin",
         content_type: Optional[str] = None,
@@ -1185,6 +1361,35 @@ class AsyncDriveFileService:
         )
         return _unwrap_data(response)
 
+    async def _wait_task(
+        self,
+        fetch: Callable[[], Awaitable[Mapping[str, Any]]],
+        *,
+        token_key: str,
+        poll_interval: float,
+        max_poll_interval: float,
+        timeout_seconds: float,
+        max_attempts: Optional[int],
+        on_complete: Optional[Callable[[Mapping[str, Any]], Union[None, Awaitable[None]]]],
+    ) -> Mapping[str, Any]:
+        deadline = time.monotonic() + timeout_seconds
+        delay = max(poll_interval, 0.0)
+        attempts = 0
+        while True:
+            data = await fetch()
+            attempts += 1
+            if _is_task_finished(data, token_key=token_key):
+                if on_complete is not None:
+                    result = on_complete(data)
+                    if inspect.isawaitable(result):
+                        await result
+                return data
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or (max_attempts is not None and attempts >= max_attempts):
+                raise TaskTimeoutError(f"drive task not finished after {attempts} polls", last_payload=data)
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 1.5, max_poll_interval)
+
     async def _request_json_raw(
         self,
         method: str,
@@ -1202,7 +1407,7 @@ class AsyncDriveFileService:
             params=params,
         )
         try:
-            payload = response.json()
+            payload = json_loads(response.content)
         except ValueError as exc:
             raise HTTPRequestError("response body is not valid json") from exc
         if not isinstance(payload, Mapping):
@@ -1232,16 +1437,17 @@ class AsyncDriveFileService:
     ) -> httpx.Response:
         token = await self._client.get_access_token()
         headers = {"Authorization": f"Bearer {token}"}
-        url = f"{self._client.config.base_url}{path}"
+        url = self._client.config.base_url + path
+        request_kwargs: dict[str, Any] = {"headers": headers, "params": params or {}}
+        if files:
+            body = _MultipartBody(_stringify_form_data(form_data or {}), files)
+            headers["Content-Type"] = body.content_type
+            headers["Content-Length"] = str(body.content_length)
+            request_kwargs["content"] = body.aiter()
+        else:
+            request_kwargs["data"] = _stringify_form_data(form_data or {})
         async with httpx.AsyncClient(timeout=self._client.config.timeout_seconds) as client:
-            response = await client.request(
-                method.upper(),
-                url,
-                headers=headers,
-                params=dict(params or {}),
-                data=_stringify_form_data(form_data or {}),
-                files=files,
-            )
+            response = await client.request(method.upper(), url, **request_kwargs)
         if response.status_code >= 400:
             raise HTTPRequestError(
                 f"http request failed: {response.status_code}",
@@ -1,9 +1,11 @@
-from typing import Any, Mapping, Optional
+import asyncio
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Sequence
 
 from ..exceptions import FeishuError
 from ..feishu import AsyncFeishuClient, FeishuClient
 from ..types import DriveResourceType, MemberIdType
-from ._common import _drop_none, _unwrap_data
+from ._common import _ResponseCache, _drop_none, _unwrap_data
 
 
 _MEMBER_TYPE_MAP = {
@@ -12,19 +14,54 @@ _MEMBER_TYPE_MAP = {
     MemberIdType.UNION_ID.value: "unionid",
 }
 
+_member_type_get = _MEMBER_TYPE_MAP.get
+
+# Freshness lifetimes for the opt-in response cache, by how quickly each view tends to change.
+_CHECK_PERMISSION_TTL_SECONDS = 5.0
+_LIST_MEMBERS_TTL_SECONDS = 15.0
+_PUBLIC_SETTINGS_TTL_SECONDS = 45.0
+
+
 def _member_type(member_id_type: str) -> str:
-    return _MEMBER_TYPE_MAP.get(member_id_type, "openid")
+    return _member_type_get(member_id_type, "openid")
 
 
 def _resource_type(resource_type: str | DriveResourceType) -> str:
-    if isinstance(resource_type, DriveResourceType):
-        return resource_type.value
-    return resource_type
+    return getattr(resource_type, "value", resource_type)
+
+
+# Shared across calls and coroutines, so they are read-only views.
+_PARAMS_BY_RESOURCE_TYPE: dict[str, Mapping[str, object]] = {
+    resource_type.value: MappingProxyType({"type": resource_type.value}) for resource_type in DriveResourceType
+}
+
+
+def _resource_params(resource_type: str | DriveResourceType) -> Mapping[str, object]:
+    value = _resource_type(resource_type)
+    params = _PARAMS_BY_RESOURCE_TYPE.get(value)
+    if params is None:
+        return {"type": value}
+    return params
+
+
+def _type_params(
+    resource_type: str | DriveResourceType,
+    need_notification: Optional[bool],
+) -> dict[str, object]:
+    params: dict[str, object] = {"type": _resource_type(resource_type)}
+    if need_notification is not None:
+        params["need_notification"] = need_notification
+    return params
 
 
 class DrivePermissionService:
-    def __init__(self, feishu_client: FeishuClient) -> None:
+    def __init__(self, feishu_client: FeishuClient, *, cache_responses: bool = False) -> None:
         self._client = feishu_client
+        self._cache = _ResponseCache() if cache_responses else None
+
+    def clear_cache(self) -> None:
+        if self._cache is not None:
+            self._cache.clear()
 
     def grant_edit_permission(
         self,
@@ -61,19 +98,17 @@ class DrivePermissionService:
         fields: Optional[str] = None,
         perm_type: Optional[str] = None,
     ) -> Mapping[str, Any]:
-        params = _drop_none(
-            {
-                "type": _resource_type(resource_type),
-                "fields": fields,
-                "perm_type": perm_type,
-            }
-        )
-        response = self._client.request_json(
-            "GET",
+        params: dict[str, object] = {"type": _resource_type(resource_type)}
+        if fields is not None:
+            params["fields"] = fields
+        if perm_type is not None:
+            params["perm_type"] = perm_type
+        return self._cached_get(
+            token,
             f"/drive/v1/permissions/{token}/members",
             params=params,
+            ttl_seconds=_LIST_MEMBERS_TTL_SECONDS,
         )
-        return _unwrap_data(response)
 
     def add_member(
         self,
@@ -86,12 +121,7 @@ class DrivePermissionService:
         member_kind: str = "user",
         need_notification: Optional[bool] = None,
     ) -> Mapping[str, Any]:
-        params = _drop_none(
-            {
-                "type": _resource_type(resource_type),
-                "need_notification": need_notification,
-            }
-        )
+        params = _type_params(resource_type, need_notification)
         response = self._client.request_json(
             "POST",
             f"/drive/v1/permissions/{token}/members",
@@ -103,6 +133,7 @@ class DrivePermissionService:
                 "type": member_kind,
             },
         )
+        self._invalidate(token)
         return _unwrap_data(response)
 
     def batch_add_members(
@@ -113,18 +144,14 @@ class DrivePermissionService:
         members: list[Mapping[str, object]],
         need_notification: Optional[bool] = None,
     ) -> Mapping[str, Any]:
-        params = _drop_none(
-            {
-                "type": _resource_type(resource_type),
-                "need_notification": need_notification,
-            }
-        )
+        params = _type_params(resource_type, need_notification)
         response = self._client.request_json(
             "POST",
             f"/drive/v1/permissions/{token}/members/batch_create",
             params=params,
-            payload={"members": [dict(member) for member in members]},
+            payload={"members": [member if type(member) is dict else dict(member) for member in members]},
         )
+        self._invalidate(token)
         return _unwrap_data(response)
 
     def update_member(
@@ -139,12 +166,7 @@ class DrivePermissionService:
         perm_type: Optional[str] = None,
         need_notification: Optional[bool] = None,
     ) -> Mapping[str, Any]:
-        params = _drop_none(
-            {
-                "type": _resource_type(resource_type),
-                "need_notification": need_notification,
-            }
-        )
+        params = _type_params(resource_type, need_notification)
         payload: dict[str, object] = {
             "member_type": _member_type(member_id_type),
             "perm": perm,
@@ -158,6 +180,7 @@ class DrivePermissionService:
             params=params,
             payload=payload,
         )
+        self._invalidate(token)
         return _unwrap_data(response)
 
     def remove_member(
@@ -169,19 +192,17 @@ class DrivePermissionService:
         member_id_type: Optional[str] = None,
         perm_type: Optional[str] = None,
     ) -> None:
-        params = _drop_none(
-            {
-                "type": _resource_type(resource_type),
-                "member_type": _member_type(member_id_type) if member_id_type else None,
-            }
-        )
-        payload = _drop_none({"perm_type": perm_type})
+        params: dict[str, object] = {"type": _resource_type(resource_type)}
+        if member_id_type:
+            params["member_type"] = _member_type(member_id_type)
+        payload = {"perm_type": perm_type} if perm_type is not None else None
         self._client.request_json(
             "DELETE",
             f"/drive/v1/permissions/{token}/members/{member_id}",
             params=params,
-            payload=payload if payload else None,
+            payload=payload,
         )
+        self._invalidate(token)
 
     def check_member_permission(
         self,
@@ -194,12 +215,12 @@ class DrivePermissionService:
             "type": _resource_type(resource_type),
             "action": action,
         }
-        response = self._client.request_json(
-            "GET",
+        return self._cached_get(
+            token,
             f"/drive/v1/permissions/{token}/members/auth",
             params=params,
+            ttl_seconds=_CHECK_PERMISSION_TTL_SECONDS,
         )
-        return _unwrap_data(response)
 
     def transfer_owner(
         self,
@@ -232,6 +253,7 @@ class DrivePermissionService:
             params=params,
             payload=payload,
         )
+        self._invalidate(token)
         return _unwrap_data(response)
 
     def get_public_settings(
@@ -240,12 +262,12 @@ class DrivePermissionService:
         *,
         resource_type: str | DriveResourceType,
     ) -> Mapping[str, Any]:
-        response = self._client.request_json(
-            "GET",
+        return self._cached_get(
+            token,
             f"/drive/v2/permissions/{token}/public",
-            params={"type": _resource_type(resource_type)},
+            params=_resource_params(resource_type),
+            ttl_seconds=_PUBLIC_SETTINGS_TTL_SECONDS,
         )
-        return _unwrap_data(response)
 
     def update_public_settings(
         self,
@@ -257,9 +279,10 @@ class DrivePermissionService:
         response = self._client.request_json(
             "PATCH",
             f"/drive/v2/permissions/{token}/public",
-            params={"type": _resource_type(resource_type)},
+            params=_resource_params(resource_type),
             payload=dict(settings),
         )
+        self._invalidate(token)
         return _unwrap_data(response)
 
     def enable_password(
@@ -271,8 +294,9 @@ class DrivePermissionService:
         response = self._client.request_json(
             "POST",
             f"/drive/v1/permissions/{token}/public/password",
-            params={"type": _resource_type(resource_type)},
+            params=_resource_params(resource_type),
         )
+        self._invalidate(token)
         return _unwrap_data(response)
 
     def refresh_password(
@@ -284,8 +308,9 @@ class DrivePermissionService:
         response = self._client.request_json(
             "PUT",
             f"/drive/v1/permissions/{token}/public/password",
-            params={"type": _resource_type(resource_type)},
+            params=_resource_params(resource_type),
         )
+        self._invalidate(token)
         return _unwrap_data(response)
 
     def disable_password(
@@ -297,13 +322,42 @@ class DrivePermissionService:
         self._client.request_json(
             "DELETE",
             f"/drive/v1/permissions/{token}/public/password",
-            params={"type": _resource_type(resource_type)},
+            params=_resource_params(resource_type),
         )
+        self._invalidate(token)
+
+    def _cached_get(
+        self,
+        token: str,
+        path: str,
+        *,
+        params: Mapping[str, object],
+        ttl_seconds: float,
+    ) -> Mapping[str, Any]:
+        cache = self._cache
+        if cache is None:
+            return _unwrap_data(self._client.request_json("GET", path, params=params))
+        key = (token, path, tuple(sorted(params.items())))
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        data = _unwrap_data(self._client.request_json("GET", path, params=params))
+        cache.set(key, data, ttl_seconds=ttl_seconds)
+        return data
+
+    def _invalidate(self, token: str) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(token)
 
 
 class AsyncDrivePermissionService:
-    def __init__(self, feishu_client: AsyncFeishuClient) -> None:
+    def __init__(self, feishu_client: AsyncFeishuClient, *, cache_responses: bool = False) -> None:
         self._client = feishu_client
+        self._cache = _ResponseCache() if cache_responses else None
+
+    def clear_cache(self) -> None:
+        if self._cache is not None:
+            self._cache.clear()
 
     async def grant_edit_permission(
         self,
@@ -314,23 +368,58 @@ class AsyncDrivePermissionService:
         resource_type: str | DriveResourceType,
         permission: str,
     ) -> None:
-        try:
-            await self.add_member(
-                token,
-                resource_type=resource_type,
-                member_id=member_id,
-                member_id_type=member_id_type,
-                perm=permission,
-            )
-            return
-        except FeishuError:
-            await self.update_member(
-                token,
-                member_id,
-                resource_type=resource_type,
-                member_id_type=member_id_type,
-                perm=permission,
-            )
+        await self.grant_edit_permissions_bulk(
+            token,
+            [member_id],
+            member_id_type,
+            resource_type=resource_type,
+            permission=permission,
+            concurrency=1,
+        )
+
+    async def grant_edit_permissions_bulk(
+        self,
+        token: str,
+        member_ids: Sequence[str],
+        member_id_type: str = MemberIdType.OPEN_ID.value,
+        *,
+        resource_type: str | DriveResourceType,
+        permission: str,
+        concurrency: int = 16,
+    ) -> None:
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def add(member_id: str) -> None:
+            async with semaphore:
+                await self.add_member(
+                    token,
+                    resource_type=resource_type,
+                    member_id=member_id,
+                    member_id_type=member_id_type,
+                    perm=permission,
+                )
+
+        async def update(member_id: str) -> None:
+            async with semaphore:
+                await self.update_member(
+                    token,
+                    member_id,
+                    resource_type=resource_type,
+                    member_id_type=member_id_type,
+                    perm=permission,
+                )
+
+        added = await asyncio.gather(*(add(member_id) for member_id in member_ids), return_exceptions=True)
+        retry_ids: list[str] = []
+        for member_id, result in zip(member_ids, added):
+            if isinstance(result, FeishuError):
+                retry_ids.append(member_id)
+            elif isinstance(result, BaseException):
+                raise result
+        updated = await asyncio.gather(*(update(member_id) for member_id in retry_ids), return_exceptions=True)
+        for result in updated:
+            if isinstance(result, BaseException):
+                raise result
 
     async def list_members(
         self,
@@ -340,19 +429,17 @@ class AsyncDrivePermissionService:
         fields: Optional[str] = None,
         perm_type: Optional[str] = None,
     ) -> Mapping[str, Any]:
-        params = _drop_none(
-            {
-                "type": _resource_type(resource_type),
-                "fields": fields,
-                "perm_type": perm_type,
-            }
-        )
-        response = await self._client.request_json(
-            "GET",
+        params: dict[str, object] = {"type": _resource_type(resource_type)}
+        if fields is not None:
+            params["fields"] = fields
+        if perm_type is not None:
+            params["perm_type"] = perm_type
+        return await self._cached_get(
+            token,
             f"/drive/v1/permissions/{token}/members",
             params=params,
+            ttl_seconds=_LIST_MEMBERS_TTL_SECONDS,
         )
-        return _unwrap_data(response)
 
     async def add_member(
         self,
@@ -365,12 +452,7 @@ class AsyncDrivePermissionService:
         member_kind: str = "user",
         need_notification: Optional[bool] = None,
     ) -> Mapping[str, Any]:
-        params = _drop_none(
-            {
-                "type": _resource_type(resource_type),
-                "need_notification": need_notification,
-            }
-        )
+        params = _type_params(resource_type, need_notification)
         response = await self._client.request_json(
             "POST",
             f"/drive/v1/permissions/{token}/members",
@@ -382,6 +464,7 @@ class AsyncDrivePermissionService:
                 "type": member_kind,
             },
         )
+        self._invalidate(token)
         return _unwrap_data(response)
 
     async def batch_add_members(
@@ -392,18 +475,14 @@ class AsyncDrivePermissionService:
         members: list[Mapping[str, object]],
         need_notification: Optional[bool] = None,
     ) -> Mapping[str, Any]:
-        params = _drop_none(
-            {
-                "type": _resource_type(resource_type),
-                "need_notification": need_notification,
-            }
-        )
+        params = _type_params(resource_type, need_notification)
         response = await self._client.request_json(
             "POST",
             f"/drive/v1/permissions/{token}/members/batch_create",
             params=params,
-            payload={"members": [dict(member) for member in members]},
+            payload={"members": [member if type(member) is dict else dict(member) for member in members]},
         )
+        self._invalidate(token)
         return _unwrap_data(response)
 
     async def update_member(
@@ -418,12 +497,7 @@ class AsyncDrivePermissionService:
         perm_type: Optional[str] = None,
         need_notification: Optional[bool] = None,
     ) -> Mapping[str, Any]:
-        params = _drop_none(
-            {
-                "type": _resource_type(resource_type),
-                "need_notification": need_notification,
-            }
-        )
+        params = _type_params(resource_type, need_notification)
         payload: dict[str, object] = {
             "member_type": _member_type(member_id_type),
             "perm": perm,
@@ -437,6 +511,7 @@ class AsyncDrivePermissionService:
             params=params,
             payload=payload,
         )
+        self._invalidate(token)
         return _unwrap_data(response)
 
     async def remove_member(
@@ -448,19 +523,17 @@ class AsyncDrivePermissionService:
         member_id_type: Optional[str] = None,
         perm_type: Optional[str] = None,
     ) -> None:
-        params = _drop_none(
-            {
-                "type": _resource_type(resource_type),
-                "member_type": _member_type(member_id_type) if member_id_type else None,
-            }
-        )
-        payload = _drop_none({"perm_type": perm_type})
+        params: dict[str, object] = {"type": _resource_type(resource_type)}
+        if member_id_type:
+            params["member_type"] = _member_type(member_id_type)
+        payload = {"perm_type": perm_type} if perm_type is not None else None
         await self._client.request_json(
             "DELETE",
             f"/drive/v1/permissions/{token}/members/{member_id}",
             params=params,
-            payload=payload if payload else None,
+            payload=payload,
         )
+        self._invalidate(token)
 
     async def check_member_permission(
         self,
@@ -473,12 +546,12 @@ class AsyncDrivePermissionService:
             "type": _resource_type(resource_type),
             "action": action,
         }
-        response = await self._client.request_json(
-            "GET",
+        return await self._cached_get(
+            token,
             f"/drive/v1/permissions/{token}/members/auth",
             params=params,
+            ttl_seconds=_CHECK_PERMISSION_TTL_SECONDS,
         )
-        return _unwrap_data(response)
 
     async def transfer_owner(
         self,
@@ -511,6 +584,7 @@ class AsyncDrivePermissionService:
             params=params,
             payload=payload,
         )
+        self._invalidate(token)
         return _unwrap_data(response)
 
     async def get_public_settings(
@@ -519,12 +593,12 @@ class AsyncDrivePermissionService:
         *,
         resource_type: str | DriveResourceType,
     ) -> Mapping[str, Any]:
-        response = await self._client.request_json(
-            "GET",
+        return await self._cached_get(
+            token,
             f"/drive/v2/permissions/{token}/public",
-            params={"type": _resource_type(resource_type)},
+            params=_resource_params(resource_type),
+            ttl_seconds=_PUBLIC_SETTINGS_TTL_SECONDS,
         )
-        return _unwrap_data(response)
 
     async def update_public_settings(
         self,
@@ -536,9 +610,10 @@ class AsyncDrivePermissionService:
         response = await self._client.request_json(
             "PATCH",
             f"/drive/v2/permissions/{token}/public",
-            params={"type": _resource_type(resource_type)},
+            params=_resource_params(resource_type),
             payload=dict(settings),
         )
+        self._invalidate(token)
         return _unwrap_data(response)
 
     async def enable_password(
@@ -550,8 +625,9 @@ class AsyncDrivePermissionService:
         response = await self._client.request_json(
             "POST",
             f"/drive/v1/permissions/{token}/public/password",
-            params={"type": _resource_type(resource_type)},
+            params=_resource_params(resource_type),
         )
+        self._invalidate(token)
         return _unwrap_data(response)
 
     async def refresh_password(
@@ -563,8 +639,9 @@ class AsyncDrivePermissionService:
         response = await self._client.request_json(
             "PUT",
             f"/drive/v1/permissions/{token}/public/password",
-            params={"type": _resource_type(resource_type)},
+            params=_resource_params(resource_type),
         )
+        self._invalidate(token)
         return _unwrap_data(response)
 
     async def disable_password(
@@ -576,5 +653,29 @@ class AsyncDrivePermissionService:
         await self._client.request_json(
             "DELETE",
             f"/drive/v1/permissions/{token}/public/password",
-            params={"type": _resource_type(resource_type)},
+            params=_resource_params(resource_type),
         )
+        self._invalidate(token)
+
+    async def _cached_get(
+        self,
+        token: str,
+        path: str,
+        *,
+        params: Mapping[str, object],
+        ttl_seconds: float,
+    ) -> Mapping[str, Any]:
+        cache = self._cache
+        if cache is None:
+            return _unwrap_data(await self._client.request_json("GET", path, params=params))
+        key = (token, path, tuple(sorted(params.items())))
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        data = _unwrap_data(await self._client.request_json("GET", path, params=params))
+        cache.set(key, data, ttl_seconds=ttl_seconds)
+        return data
+
+    def _invalidate(self, token: str) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(token)
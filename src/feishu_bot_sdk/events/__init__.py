@@ -42,6 +42,7 @@ from .message_content import (
     VoteMessageContent,
     extract_text_from_parsed_message,
     parse_received_message_content,
+    parse_received_message_content_batch,
 )
 from .predefined import FeishuEventRegistry
 from .idempotency import (
@@ -97,5 +98,6 @@ __all__ = [
     "extract_text_from_parsed_message",
     "is_async_handler",
     "parse_received_message_content",
+    "parse_received_message_content_batch",
     "parse_event_envelope",
 ]
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+
+def _as_optional_str(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return str(value)
+
+
+def _as_optional_int(value: Any) -> Optional[int]:
+    if value is None or type(value) is int:
+        return value
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value)
+    if isinstance(value, str):
+        stripped = value.strip()
+        if not stripped:
+            return None
+        try:
+            return int(stripped)
+        except ValueError:
+            return None
+    return None
+
+
+def _as_string_list(value: Any) -> list[str]:
+    if not value or not isinstance(value, list):
+        return []
+    return [text for text in map(_as_optional_str, value) if text is not None]
@@ -1,26 +1,36 @@
+import sys
+from types import MappingProxyType
 from typing import Any, Mapping, MutableMapping, Optional
 
 from .types import EventContext, EventEnvelope
 
 
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
 def _as_mapping(value: Any) -> Mapping[str, Any]:
     if isinstance(value, Mapping):
         return value
-    return {}
+    return _EMPTY_MAPPING
 
 
 def _as_optional_str(value: Any) -> Optional[str]:
-    if value is None:
-        return None
+    if value is None or type(value) is str:
+        return value
     if isinstance(value, str):
         return value
     return str(value)
 
 
 def detect_event_schema(payload: Mapping[str, Any]) -> str:
-    schema = _as_optional_str(payload.get("schema"))
-    if schema == "2.0" and isinstance(payload.get("header"), Mapping):
-        return "p2"
+    schema = payload.get("schema")
+    if schema != "2.0":
+        schema = _as_optional_str(schema)
+    if schema == "2.0":
+        header = payload.get("header")
+        # json-decoded headers are plain dicts; skip the ABC instance check for them.
+        if type(header) is dict or isinstance(header, Mapping):
+            return "p2"
     if "uuid" in payload or "ts" in payload:
         return "p1"
     if isinstance(payload.get("event"), Mapping):
@@ -51,24 +61,25 @@ def build_event_context(
     event = payload.get("event")
     if event is None:
         event = {}
-    return EventContext(envelope=envelope, payload=dict(payload), event=event)
+    # envelope.raw is already a private copy of the payload; both sides are read-only.
+    return EventContext(envelope=envelope, payload=envelope.raw, event=event)
 
 
 def _parse_p2_envelope(payload: Mapping[str, Any], *, is_callback: bool) -> EventEnvelope:
-    header = _as_mapping(payload.get("header"))
+    header_get = _as_mapping(payload.get("header")).get
     challenge = _as_optional_str(payload.get("challenge"))
-    event_type = _as_optional_str(header.get("event_type")) or _as_optional_str(payload.get("type")) or ""
+    event_type = _as_optional_str(header_get("event_type")) or _as_optional_str(payload.get("type")) or ""
     if not event_type and challenge is not None:
         event_type = "url_verification"
 
     return EventEnvelope(
         schema="p2",
-        event_type=event_type,
-        event_id=_as_optional_str(header.get("event_id")),
-        token=_as_optional_str(header.get("token")),
-        tenant_key=_as_optional_str(header.get("tenant_key")),
-        app_id=_as_optional_str(header.get("app_id")),
-        create_time=_as_optional_str(header.get("create_time")),
+        event_type=_intern(event_type),
+        event_id=_as_optional_str(header_get("event_id")),
+        token=_as_optional_str(header_get("token")),
+        tenant_key=_as_optional_str(header_get("tenant_key")),
+        app_id=_as_optional_str(header_get("app_id")),
+        create_time=_as_optional_str(header_get("create_time")),
         challenge=challenge,
         is_callback=is_callback,
         raw=_clone_mapping(payload),
@@ -84,7 +95,7 @@ def _parse_p1_envelope(payload: Mapping[str, Any], *, is_callback: bool) -> Even
 
     return EventEnvelope(
         schema="p1",
-        event_type=event_type,
+        event_type=_intern(event_type),
         event_id=_as_optional_str(payload.get("uuid")),
         token=_as_optional_str(payload.get("token")),
         tenant_key=_as_optional_str(event.get("tenant_key")) or _as_optional_str(payload.get("tenant_key")),
@@ -110,6 +121,13 @@ def _parse_unknown_envelope(payload: Mapping[str, Any], *, is_callback: bool) ->
     )
 
 
+def _intern(value: str) -> str:
+    # Interned event types make the handler-registry lookup a pointer comparison.
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
 def _clone_mapping(payload: Mapping[str, Any]) -> Mapping[str, Any]:
     cloned: MutableMapping[str, Any] = {}
     for key, value in payload.items():
@@ -1,6 +1,8 @@
 import inspect
+import sys
 import threading
-from typing import Any, Awaitable, Callable, Dict, Optional, Union
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from .types import EventContext
 
@@ -9,21 +11,44 @@ AsyncEventHandler = Callable[[EventContext], Awaitable[Any]]
 _RegisteredHandler = Union[SyncEventHandler, AsyncEventHandler]
 
 
+_ASYNC_HANDLER_CACHE: "weakref.WeakKeyDictionary[Any, bool]" = weakref.WeakKeyDictionary()
+
+
 def is_async_handler(handler: _RegisteredHandler) -> bool:
-    return inspect.iscoroutinefunction(handler)
+    try:
+        return _ASYNC_HANDLER_CACHE[handler]
+    except (KeyError, TypeError):
+        pass
+    # inspect already unwraps functools.partial; objects with an async __call__ need the extra look.
+    result = inspect.iscoroutinefunction(handler)
+    if not result and not inspect.isroutine(handler):
+        result = inspect.iscoroutinefunction(getattr(handler, "__call__", None))
+    try:
+        _ASYNC_HANDLER_CACHE[handler] = result
+    except TypeError:
+        pass
+    return result
 
 
 class EventHandlerRegistry:
     def __init__(self) -> None:
+        # Handlers are registered at startup and read on every event, so writers publish a fresh
+        # dict under the lock and readers use whatever snapshot is current without locking.
         self._handlers: Dict[str, _RegisteredHandler] = {}
         self._default_handler: Optional[_RegisteredHandler] = None
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
 
     def register(self, event_type: str, handler: _RegisteredHandler) -> None:
         if not event_type:
             raise ValueError("event_type must not be empty")
+        is_async_handler(handler)  # warm the cache so dispatch never reflects on the handler
+        if type(event_type) is str:
+            # Envelopes intern their event_type too, so dispatch lookups match on identity.
+            event_type = sys.intern(event_type)
         with self._lock:
-            self._handlers[event_type] = handler
+            handlers = dict(self._handlers)
+            handlers[event_type] = handler
+            self._handlers = handlers
 
     def register_default(self, handler: _RegisteredHandler) -> None:
         with self._lock:
@@ -31,14 +56,17 @@ class EventHandlerRegistry:
 
     def unregister(self, event_type: str) -> None:
         with self._lock:
-            self._handlers.pop(event_type, None)
+            if event_type not in self._handlers:
+                return
+            handlers = dict(self._handlers)
+            del handlers[event_type]
+            self._handlers = handlers
 
     def get_handler(self, event_type: str) -> Optional[_RegisteredHandler]:
-        with self._lock:
-            handler = self._handlers.get(event_type)
-            if handler is not None:
-                return handler
-            return self._default_handler
+        handler = self._handlers.get(event_type)
+        if handler is not None:
+            return handler
+        return self._default_handler
 
     def has_handler(self, event_type: str) -> bool:
         return self.get_handler(event_type) is not None
@@ -55,7 +83,47 @@ class EventHandlerRegistry:
         handler = self.get_handler(context.envelope.event_type)
         if handler is None:
             raise KeyError(f"event handler not found: {context.envelope.event_type}")
+        if is_async_handler(handler):
+            return await handler(context)
         result = handler(context)
         if inspect.isawaitable(result):
             return await result
         return result
+
+    def dispatch_batch(self, contexts: Iterable[EventContext]) -> List[Any]:
+        # Handlers are resolved once per event type; events still run in delivery order.
+        resolved: Dict[str, _RegisteredHandler] = {}
+        results: List[Any] = []
+        for context in contexts:
+            event_type = context.envelope.event_type
+            handler = resolved.get(event_type)
+            if handler is None:
+                handler = self.get_handler(event_type)
+                if handler is None:
+                    raise KeyError(f"event handler not found: {event_type}")
+                if is_async_handler(handler):
+                    raise RuntimeError("async handler is not supported by dispatch_batch(), use adispatch_batch()")
+                resolved[event_type] = handler
+            results.append(handler(context))
+        return results
+
+    async def adispatch_batch(self, contexts: Iterable[EventContext]) -> List[Any]:
+        resolved: Dict[str, Tuple[_RegisteredHandler, bool]] = {}
+        results: List[Any] = []
+        for context in contexts:
+            event_type = context.envelope.event_type
+            entry = resolved.get(event_type)
+            if entry is None:
+                handler = self.get_handler(event_type)
+                if handler is None:
+                    raise KeyError(f"event handler not found: {event_type}")
+                entry = resolved[event_type] = (handler, is_async_handler(handler))
+            handler, is_async = entry
+            if is_async:
+                results.append(await handler(context))
+                continue
+            result = handler(context)
+            if inspect.isawaitable(result):
+                result = await result
+            results.append(result)
+        return results
@@ -1,11 +1,16 @@
-import asyncio
+import heapq
 import threading
 import time
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .types import EventEnvelope
 
 
+# Expiry reported for keys that were never seen: -inf is always in the past, so a missing key
+# reads as already expired and lookups stay a single dict get plus one float comparison.
+_ALREADY_EXPIRED = float("-inf")
+
+
 def build_idempotency_key(envelope: EventEnvelope) -> Optional[str]:
     if envelope.is_url_verification:
         return None
@@ -18,6 +23,7 @@ class MemoryIdempotencyStore:
     def __init__(self, *, cleanup_interval_seconds: float = 300.0) -> None:
         self._cleanup_interval_seconds = cleanup_interval_seconds
         self._data: Dict[str, float] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
         self._last_cleanup = 0.0
         self._lock = threading.Lock()
 
@@ -27,10 +33,11 @@ class MemoryIdempotencyStore:
         now = time.monotonic()
         with self._lock:
             self._cleanup_if_needed(now)
-            expires_at = self._data.get(key)
-            if expires_at is not None and expires_at > now:
+            if self._data.get(key, _ALREADY_EXPIRED) > now:
                 return False
-            self._data[key] = now + ttl_seconds
+            expires_at = now + ttl_seconds
+            self._data[key] = expires_at
+            heapq.heappush(self._expiry_heap, (expires_at, key))
             return True
 
     def seen(self, key: str) -> bool:
@@ -39,8 +46,7 @@ class MemoryIdempotencyStore:
         now = time.monotonic()
         with self._lock:
             self._cleanup_if_needed(now)
-            expires_at = self._data.get(key)
-            return expires_at is not None and expires_at > now
+            return self._data.get(key, _ALREADY_EXPIRED) > now
 
     def delete(self, key: str) -> None:
         with self._lock:
@@ -49,56 +55,64 @@ class MemoryIdempotencyStore:
     def clear(self) -> None:
         with self._lock:
             self._data.clear()
+            self._expiry_heap.clear()
 
     def _cleanup_if_needed(self, now: float) -> None:
         if now - self._last_cleanup < self._cleanup_interval_seconds:
             return
         self._last_cleanup = now
-        expired_keys = [key for key, expires_at in self._data.items() if expires_at <= now]
-        for key in expired_keys:
-            self._data.pop(key, None)
+        # Pop only the expired prefix of the heap; entries left behind by delete() or a
+        # re-mark no longer match the stored expiry and are simply discarded.
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            if self._data.get(key) == expires_at:
+                del self._data[key]
 
 
 class AsyncMemoryIdempotencyStore:
     def __init__(self, *, cleanup_interval_seconds: float = 300.0) -> None:
         self._cleanup_interval_seconds = cleanup_interval_seconds
         self._data: Dict[str, float] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
         self._last_cleanup = 0.0
-        self._lock = asyncio.Lock()
+        # No lock: none of the critical sections await, so they cannot interleave with other
+        # coroutines on the same event loop. The store must only be used from one loop.
 
     async def mark_once(self, key: str, *, ttl_seconds: float = 86_400.0) -> bool:
         if not key:
             return True
         now = time.monotonic()
-        async with self._lock:
-            self._cleanup_if_needed(now)
-            expires_at = self._data.get(key)
-            if expires_at is not None and expires_at > now:
-                return False
-            self._data[key] = now + ttl_seconds
-            return True
+        self._cleanup_if_needed(now)
+        if self._data.get(key, _ALREADY_EXPIRED) > now:
+            return False
+        expires_at = now + ttl_seconds
+        self._data[key] = expires_at
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+        return True
 
     async def seen(self, key: str) -> bool:
         if not key:
             return False
         now = time.monotonic()
-        async with self._lock:
-            self._cleanup_if_needed(now)
-            expires_at = self._data.get(key)
-            return expires_at is not None and expires_at > now
+        self._cleanup_if_needed(now)
+        return self._data.get(key, _ALREADY_EXPIRED) > now
 
     async def delete(self, key: str) -> None:
-        async with self._lock:
-            self._data.pop(key, None)
+        self._data.pop(key, None)
 
     async def clear(self) -> None:
-        async with self._lock:
-            self._data.clear()
+        self._data.clear()
+        self._expiry_heap.clear()
 
     def _cleanup_if_needed(self, now: float) -> None:
         if now - self._last_cleanup < self._cleanup_interval_seconds:
             return
         self._last_cleanup = now
-        expired_keys = [key for key, expires_at in self._data.items() if expires_at <= now]
-        for key in expired_keys:
-            self._data.pop(key, None)
+        # Pop only the expired prefix of the heap; entries left behind by delete() or a
+        # re-mark no longer match the stored expiry and are simply discarded.
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            if self._data.get(key) == expires_at:
+                del self._data[key]
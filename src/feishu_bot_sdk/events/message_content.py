@@ -1,90 +1,53 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
-from typing import Any, Callable, Literal, Mapping, Optional
+from typing import Any, Callable, Iterable, Literal, Mapping, Optional
+
+from .._json import json_loads
+from ._coerce import _as_optional_int, _as_optional_str, _as_string_list
 
 
 def _as_mapping(value: Any) -> Mapping[str, Any]:
+    # Decoded JSON objects are plain dicts with str keys already; only other mappings need rebuilding.
+    if type(value) is dict:
+        return value
     if isinstance(value, Mapping):
         return {str(key): item for key, item in value.items()}
     return {}
 
 
-def _as_optional_str(value: Any) -> Optional[str]:
-    if value is None:
-        return None
-    if isinstance(value, str):
-        return value
-    return str(value)
-
-
-def _as_optional_int(value: Any) -> Optional[int]:
-    if value is None:
-        return None
-    if isinstance(value, bool):
-        return None
-    if isinstance(value, int):
-        return value
-    if isinstance(value, float):
-        return int(value)
-    if isinstance(value, str):
-        stripped = value.strip()
-        if not stripped:
-            return None
-        try:
-            return int(stripped)
-        except ValueError:
-            return None
-    return None
-
-
-def _as_string_list(value: Any) -> list[str]:
-    if not isinstance(value, list):
-        return []
-    items: list[str] = []
-    for item in value:
-        text = _as_optional_str(item)
-        if text is not None:
-            items.append(text)
-    return items
-
-
 def _as_post_lines(value: Any) -> list[list[Mapping[str, Any]]]:
     if not isinstance(value, list):
         return []
-    lines: list[list[Mapping[str, Any]]] = []
-    for line in value:
-        if not isinstance(line, list):
-            continue
-        nodes: list[Mapping[str, Any]] = []
-        for node in line:
-            if isinstance(node, Mapping):
-                nodes.append({str(key): item for key, item in node.items()})
-        lines.append(nodes)
-    return lines
+    return [
+        [_as_mapping(node) for node in line if type(node) is dict or isinstance(node, Mapping)]
+        for line in value
+        if isinstance(line, list)
+    ]
 
 
 def _parse_content_json(content_raw: str) -> tuple[Mapping[str, Any], Optional[str]]:
     if not content_raw:
         return {}, None
     try:
-        payload = json.loads(content_raw)
-    except json.JSONDecodeError as exc:
+        payload = json_loads(content_raw)
+    except ValueError as exc:
         return {}, f"{type(exc).__name__}: {exc}"
+    if type(payload) is dict:
+        return payload, None
     if not isinstance(payload, Mapping):
         return {}, "content is not a JSON object"
     return {str(key): value for key, value in payload.items()}, None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TextMessageContent:
     message_type: Literal["text"] = "text"
     text: Optional[str] = None
     raw: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PostMessageContent:
     message_type: Literal["post"] = "post"
     title: Optional[str] = None
@@ -94,14 +57,14 @@ class PostMessageContent:
     raw: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImageMessageContent:
     message_type: Literal["image"] = "image"
     image_key: Optional[str] = None
     raw: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileMessageContent:
     message_type: Literal["file"] = "file"
     file_key: Optional[str] = None
@@ -109,7 +72,7 @@ class FileMessageContent:
     raw: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FolderMessageContent:
     message_type: Literal["folder"] = "folder"
     file_key: Optional[str] = None
@@ -117,7 +80,7 @@ class FolderMessageContent:
     raw: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AudioMessageContent:
     message_type: Literal["audio"] = "audio"
     file_key: Optional[str] = None
@@ -125,7 +88,7 @@ class AudioMessageContent:
     raw: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MediaMessageContent:
     message_type: Literal["media"] = "media"
     file_key: Optional[str] = None
@@ -135,14 +98,14 @@ class MediaMessageContent:
     raw: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StickerMessageContent:
     message_type: Literal["sticker"] = "sticker"
     file_key: Optional[str] = None
     raw: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InteractiveMessageContent:
     message_type: Literal["interactive"] = "interactive"
     title: Optional[str] = None
@@ -150,14 +113,14 @@ class InteractiveMessageContent:
     raw: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HongbaoMessageContent:
     message_type: Literal["hongbao"] = "hongbao"
     text: Optional[str] = None
     raw: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CalendarMessageContent:
     message_type: str
     summary: Optional[str] = None
@@ -166,21 +129,21 @@ class CalendarMessageContent:
     raw: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShareChatMessageContent:
     message_type: Literal["share_chat"] = "share_chat"
     chat_id: Optional[str] = None
     raw: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShareUserMessageContent:
     message_type: Literal["share_user"] = "share_user"
     user_id: Optional[str] = None
     raw: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SystemMessageContent:
     message_type: Literal["system"] = "system"
     template: Optional[str] = None
@@ -190,7 +153,7 @@ class SystemMessageContent:
     raw: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LocationMessageContent:
     message_type: Literal["location"] = "location"
     name: Optional[str] = None
@@ -199,7 +162,7 @@ class LocationMessageContent:
     raw: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VideoChatMessageContent:
     message_type: Literal["video_chat"] = "video_chat"
     topic: Optional[str] = None
@@ -207,7 +170,7 @@ class VideoChatMessageContent:
     raw: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TodoMessageContent:
     message_type: Literal["todo"] = "todo"
     task_id: Optional[str] = None
@@ -216,7 +179,7 @@ class TodoMessageContent:
     raw: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VoteMessageContent:
     message_type: Literal["vote"] = "vote"
     topic: Optional[str] = None
@@ -224,14 +187,14 @@ class VoteMessageContent:
     raw: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MergeForwardMessageContent:
     message_type: Literal["merge_forward"] = "merge_forward"
     content: Optional[str] = None
     raw: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UnknownMessageContent:
     message_type: str
     content_raw: str
@@ -263,10 +226,13 @@ ParsedMessageContent = (
 )
 
 
+# Parsers receive the dict freshly decoded by _parse_content_json, which nothing else references,
+# so they store it as ``raw`` directly instead of copying it. Nested lists and dicts are shared
+# between ``raw`` and the parsed fields; the public parse functions document this.
 def _parse_text_message(_message_type: str, payload: Mapping[str, Any]) -> TextMessageContent:
     return TextMessageContent(
         text=_as_optional_str(payload.get("text")),
-        raw=dict(payload),
+        raw=payload,
     )
 
 
@@ -277,18 +243,18 @@ def _parse_post_message(_message_type: str, payload: Mapping[str, Any]) -> PostM
         return PostMessageContent(
             title=title,
             content=content,
-            raw=dict(payload),
+            raw=payload,
         )
 
     locales: dict[str, Mapping[str, Any]] = {}
     for key, value in payload.items():
-        if isinstance(value, Mapping):
-            locale_payload = {str(item_key): item for item_key, item in value.items()}
+        if type(value) is dict or isinstance(value, Mapping):
+            locale_payload = _as_mapping(value)
             if isinstance(locale_payload.get("content"), list):
                 locales[str(key)] = locale_payload
 
     if not locales:
-        return PostMessageContent(raw=dict(payload))
+        return PostMessageContent(raw=payload)
 
     locale = next(iter(locales))
     locale_payload = locales[locale]
@@ -297,14 +263,14 @@ def _parse_post_message(_message_type: str, payload: Mapping[str, Any]) -> PostM
         content=_as_post_lines(locale_payload.get("content")),
         locale=locale,
         locales=locales,
-        raw=dict(payload),
+        raw=payload,
     )
 
 
 def _parse_image_message(_message_type: str, payload: Mapping[str, Any]) -> ImageMessageContent:
     return ImageMessageContent(
         image_key=_as_optional_str(payload.get("image_key")),
-        raw=dict(payload),
+        raw=payload,
     )
 
 
@@ -312,7 +278,7 @@ def _parse_file_message(_message_type: str, payload: Mapping[str, Any]) -> FileM
     return FileMessageContent(
         file_key=_as_optional_str(payload.get("file_key")),
         file_name=_as_optional_str(payload.get("file_name")),
-        raw=dict(payload),
+        raw=payload,
     )
 
 
@@ -320,7 +286,7 @@ def _parse_folder_message(_message_type: str, payload: Mapping[str, Any]) -> Fol
     return FolderMessageContent(
         file_key=_as_optional_str(payload.get("file_key")),
         file_name=_as_optional_str(payload.get("file_name")),
-        raw=dict(payload),
+        raw=payload,
     )
 
 
@@ -328,7 +294,7 @@ def _parse_audio_message(_message_type: str, payload: Mapping[str, Any]) -> Audi
     return AudioMessageContent(
         file_key=_as_optional_str(payload.get("file_key")),
         duration=_as_optional_int(payload.get("duration")),
-        raw=dict(payload),
+        raw=payload,
     )
 
 
@@ -338,14 +304,14 @@ def _parse_media_message(_message_type: str, payload: Mapping[str, Any]) -> Medi
         image_key=_as_optional_str(payload.get("image_key")),
         file_name=_as_optional_str(payload.get("file_name")),
         duration=_as_optional_int(payload.get("duration")),
-        raw=dict(payload),
+        raw=payload,
     )
 
 
 def _parse_sticker_message(_message_type: str, payload: Mapping[str, Any]) -> StickerMessageContent:
     return StickerMessageContent(
         file_key=_as_optional_str(payload.get("file_key")),
-        raw=dict(payload),
+        raw=payload,
     )
 
 
@@ -353,39 +319,42 @@ def _parse_interactive_message(_message_type: str, payload: Mapping[str, Any]) -
     return InteractiveMessageContent(
         title=_as_optional_str(payload.get("title")),
         elements=_as_post_lines(payload.get("elements")),
-        raw=dict(payload),
+        raw=payload,
     )
 
 
 def _parse_hongbao_message(_message_type: str, payload: Mapping[str, Any]) -> HongbaoMessageContent:
     return HongbaoMessageContent(
         text=_as_optional_str(payload.get("text")),
-        raw=dict(payload),
+        raw=payload,
     )
 
 
+_CALENDAR_TYPES = frozenset({"share_calendar_event", "calendar", "general_calendar"})
+
+
 def _parse_calendar_message(message_type: str, payload: Mapping[str, Any]) -> CalendarMessageContent:
-    calendar_type = message_type if message_type in {"share_calendar_event", "calendar", "general_calendar"} else "calendar"
+    calendar_type = message_type if message_type in _CALENDAR_TYPES else "calendar"
     return CalendarMessageContent(
         message_type=calendar_type,
         summary=_as_optional_str(payload.get("summary")),
         start_time=_as_optional_str(payload.get("start_time")),
         end_time=_as_optional_str(payload.get("end_time")),
-        raw=dict(payload),
+        raw=payload,
     )
 
 
 def _parse_share_chat_message(_message_type: str, payload: Mapping[str, Any]) -> ShareChatMessageContent:
     return ShareChatMessageContent(
         chat_id=_as_optional_str(payload.get("chat_id")),
-        raw=dict(payload),
+        raw=payload,
     )
 
 
 def _parse_share_user_message(_message_type: str, payload: Mapping[str, Any]) -> ShareUserMessageContent:
     return ShareUserMessageContent(
         user_id=_as_optional_str(payload.get("user_id")),
-        raw=dict(payload),
+        raw=payload,
     )
 
 
@@ -395,7 +364,7 @@ def _parse_system_message(_message_type: str, payload: Mapping[str, Any]) -> Sys
         from_user=_as_string_list(payload.get("from_user")),
         to_chatters=_as_string_list(payload.get("to_chatters")),
         divider_text=_as_mapping(payload.get("divider_text")),
-        raw=dict(payload),
+        raw=payload,
     )
 
 
@@ -404,7 +373,7 @@ def _parse_location_message(_message_type: str, payload: Mapping[str, Any]) -> L
         name=_as_optional_str(payload.get("name")),
         longitude=_as_optional_str(payload.get("longitude")),
         latitude=_as_optional_str(payload.get("latitude")),
-        raw=dict(payload),
+        raw=payload,
     )
 
 
@@ -412,7 +381,7 @@ def _parse_video_chat_message(_message_type: str, payload: Mapping[str, Any]) ->
     return VideoChatMessageContent(
         topic=_as_optional_str(payload.get("topic")),
         start_time=_as_optional_str(payload.get("start_time")),
-        raw=dict(payload),
+        raw=payload,
     )
 
 
@@ -421,7 +390,7 @@ def _parse_todo_message(_message_type: str, payload: Mapping[str, Any]) -> TodoM
         task_id=_as_optional_str(payload.get("task_id")),
         summary=_as_mapping(payload.get("summary")),
         due_time=_as_optional_str(payload.get("due_time")),
-        raw=dict(payload),
+        raw=payload,
     )
 
 
@@ -429,18 +398,20 @@ def _parse_vote_message(_message_type: str, payload: Mapping[str, Any]) -> VoteM
     return VoteMessageContent(
         topic=_as_optional_str(payload.get("topic")),
         options=_as_string_list(payload.get("options")),
-        raw=dict(payload),
+        raw=payload,
     )
 
 
 def _parse_merge_forward_message(_message_type: str, payload: Mapping[str, Any]) -> MergeForwardMessageContent:
     return MergeForwardMessageContent(
         content=_as_optional_str(payload.get("content")),
-        raw=dict(payload),
+        raw=payload,
     )
 
 
-_PARSER_TABLE: dict[str, Callable[[str, Mapping[str, Any]], ParsedMessageContent]] = {
+_ContentParser = Callable[[str, Mapping[str, Any]], ParsedMessageContent]
+
+_PARSER_TABLE: dict[str, _ContentParser] = {
     "text": _parse_text_message,
     "post": _parse_post_message,
     "image": _parse_image_message,
@@ -465,14 +436,34 @@ _PARSER_TABLE: dict[str, Callable[[str, Mapping[str, Any]], ParsedMessageContent
 }
 
 
-def parse_received_message_content(
-    *,
+# Maps any equal string to the table's own key object, so known message types stored on parsed
+# content share one interned string instead of each event carrying its own copy.
+# One lookup yields both the canonical type string and its parser.
+_DISPATCH_TABLE: dict[str, tuple[str, _ContentParser]] = {
+    message_type: (message_type, parser) for message_type, parser in _PARSER_TABLE.items()
+}
+
+
+def _resolve_parser(
     message_type: Optional[str],
+) -> tuple[str, Optional[_ContentParser]]:
+    # Feishu already sends lowercase types, so only normalise when the raw value misses the table.
+    normalized_type = message_type or ""
+    entry = _DISPATCH_TABLE.get(normalized_type)
+    if entry is None:
+        normalized_type = normalized_type.strip().lower()
+        entry = _DISPATCH_TABLE.get(normalized_type)
+    if entry is None:
+        return normalized_type, None
+    return entry
+
+
+def _parse_resolved(
+    normalized_type: str,
+    parser: Optional[_ContentParser],
     content_raw: str,
 ) -> ParsedMessageContent:
-    normalized_type = (message_type or "").strip().lower()
     payload, parse_error = _parse_content_json(content_raw)
-    parser = _PARSER_TABLE.get(normalized_type)
     if parser is None:
         return UnknownMessageContent(
             message_type=normalized_type or "unknown",
@@ -490,9 +481,40 @@ def parse_received_message_content(
     return parser(normalized_type, payload)
 
 
+def parse_received_message_content(
+    *,
+    message_type: Optional[str],
+    content_raw: str,
+) -> ParsedMessageContent:
+    """Parse a received message's JSON ``content`` into its typed content model.
+
+    ``raw`` holds the decoded payload itself, not a copy, and parsed fields such as post
+    lines reuse its nested lists and dicts. Mutating ``raw`` changes the parsed fields and
+    vice versa; deep-copy ``raw`` first if it needs to be edited independently.
+    """
+    normalized_type, parser = _resolve_parser(message_type)
+    return _parse_resolved(normalized_type, parser, content_raw)
+
+
+def parse_received_message_content_batch(
+    items: Iterable[tuple[Optional[str], str]],
+) -> list[ParsedMessageContent]:
+    """Parse ``(message_type, content_raw)`` pairs in order, resolving each type's parser once.
+
+    Results share objects between ``raw`` and parsed fields exactly like
+    :func:`parse_received_message_content`.
+    """
+    resolved: dict[Optional[str], tuple[str, Optional[_ContentParser]]] = {}
+    results: list[ParsedMessageContent] = []
+    for message_type, content_raw in items:
+        entry = resolved.get(message_type)
+        if entry is None:
+            entry = resolved[message_type] = _resolve_parser(message_type)
+        results.append(_parse_resolved(entry[0], entry[1], content_raw))
+    return results
+
+
 def extract_text_from_parsed_message(content: ParsedMessageContent) -> Optional[str]:
-    if isinstance(content, TextMessageContent):
-        return content.text
-    if isinstance(content, HongbaoMessageContent):
+    if isinstance(content, (TextMessageContent, HongbaoMessageContent)):
         return content.text
     return None
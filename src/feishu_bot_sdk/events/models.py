@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Any, Mapping, Optional
+from typing import Any, Mapping, Optional, TypeVar
 
+from ._coerce import _as_optional_int, _as_optional_str, _as_string_list
 from .message_content import (
     ParsedMessageContent,
     extract_text_from_parsed_message,
@@ -10,61 +11,20 @@ from .types import EventContext
 
 
 def _as_mapping(value: Any) -> Mapping[str, Any]:
-    if isinstance(value, Mapping):
+    # Event payloads are decoded JSON, so a concrete dict check settles almost every call
+    # before the slower Mapping ABC check.
+    if type(value) is dict or isinstance(value, Mapping):
         return value
     return {}
 
 
-def _as_optional_str(value: Any) -> Optional[str]:
-    if value is None:
-        return None
-    if isinstance(value, str):
-        return value
-    return str(value)
-
-
-def _as_optional_int(value: Any) -> Optional[int]:
-    if value is None:
-        return None
-    if isinstance(value, bool):
-        return None
-    if isinstance(value, int):
-        return value
-    if isinstance(value, float):
-        return int(value)
-    if isinstance(value, str):
-        stripped = value.strip()
-        if not stripped:
-            return None
-        try:
-            return int(stripped)
-        except ValueError:
-            return None
-    return None
-
-
 def _as_mapping_list(value: Any) -> list[Mapping[str, Any]]:
     if not isinstance(value, list):
         return []
-    items: list[Mapping[str, Any]] = []
-    for item in value:
-        if isinstance(item, Mapping):
-            items.append(dict(item))
-    return items
+    return [dict(item) for item in value if type(item) is dict or isinstance(item, Mapping)]
 
 
-def _as_string_list(value: Any) -> list[str]:
-    if not isinstance(value, list):
-        return []
-    items: list[str] = []
-    for item in value:
-        parsed = _as_optional_str(item)
-        if parsed is not None:
-            items.append(parsed)
-    return items
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class P2ImMessageReceiveV1:
     event_id: Optional[str]
     create_time: Optional[str]
@@ -84,37 +44,39 @@ class P2ImMessageReceiveV1:
 
     @classmethod
     def from_context(cls, context: EventContext) -> "P2ImMessageReceiveV1":
+        # Hottest model in the SDK: bind the lookups once instead of re-resolving them per field.
+        as_str = _as_optional_str
+        envelope = context.envelope
         event = _as_mapping(context.event)
-        message = _as_mapping(event.get("message"))
-        sender = _as_mapping(event.get("sender"))
-        sender_id = _as_mapping(sender.get("sender_id"))
-        message_type = _as_optional_str(message.get("message_type"))
-        content_raw = _as_optional_str(message.get("content")) or ""
+        message_get = _as_mapping(event.get("message")).get
+        sender_id_get = _as_mapping(_as_mapping(event.get("sender")).get("sender_id")).get
+        message_type = as_str(message_get("message_type"))
+        content_raw = as_str(message_get("content")) or ""
         content = parse_received_message_content(
             message_type=message_type,
             content_raw=content_raw,
         )
         text = extract_text_from_parsed_message(content)
         return cls(
-            event_id=context.envelope.event_id,
-            create_time=context.envelope.create_time,
-            tenant_key=context.envelope.tenant_key,
-            app_id=context.envelope.app_id,
-            message_id=_as_optional_str(message.get("message_id")),
-            chat_id=_as_optional_str(message.get("chat_id")),
-            chat_type=_as_optional_str(message.get("chat_type")),
+            event_id=envelope.event_id,
+            create_time=envelope.create_time,
+            tenant_key=envelope.tenant_key,
+            app_id=envelope.app_id,
+            message_id=as_str(message_get("message_id")),
+            chat_id=as_str(message_get("chat_id")),
+            chat_type=as_str(message_get("chat_type")),
             message_type=message_type,
             content_raw=content_raw,
             content=content,
             text=text,
-            sender_open_id=_as_optional_str(sender_id.get("open_id")),
-            sender_user_id=_as_optional_str(sender_id.get("user_id")),
-            sender_union_id=_as_optional_str(sender_id.get("union_id")),
-            raw=dict(context.payload),
+            sender_open_id=as_str(sender_id_get("open_id")),
+            sender_user_id=as_str(sender_id_get("user_id")),
+            sender_union_id=as_str(sender_id_get("union_id")),
+            raw=context.payload,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class P2ImMessageReadV1:
     event_id: Optional[str]
     create_time: Optional[str]
@@ -144,11 +106,11 @@ class P2ImMessageReadV1:
             read_time=_as_optional_str(reader.get("read_time")),
             reader_tenant_key=_as_optional_str(reader.get("tenant_key")),
             message_id_list=_as_string_list(event.get("message_id_list")),
-            raw=dict(context.payload),
+            raw=context.payload,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class P2ImMessageRecalledV1:
     event_id: Optional[str]
     create_time: Optional[str]
@@ -172,11 +134,11 @@ class P2ImMessageRecalledV1:
             chat_id=_as_optional_str(event.get("chat_id")),
             recall_time=_as_optional_str(event.get("recall_time")),
             recall_type=_as_optional_str(event.get("recall_type")),
-            raw=dict(context.payload),
+            raw=context.payload,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class P2ImMessageReactionCreatedV1:
     event_id: Optional[str]
     create_time: Optional[str]
@@ -210,11 +172,11 @@ class P2ImMessageReactionCreatedV1:
             operator_union_id=_as_optional_str(operator.get("union_id")),
             operator_app_id=_as_optional_str(event.get("app_id")),
             action_time=_as_optional_str(event.get("action_time")),
-            raw=dict(context.payload),
+            raw=context.payload,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class P2ImMessageReactionDeletedV1:
     event_id: Optional[str]
     create_time: Optional[str]
@@ -248,11 +210,11 @@ class P2ImMessageReactionDeletedV1:
             operator_union_id=_as_optional_str(operator.get("union_id")),
             operator_app_id=_as_optional_str(event.get("app_id")),
             action_time=_as_optional_str(event.get("action_time")),
-            raw=dict(context.payload),
+            raw=context.payload,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class P2ApplicationBotMenuV6:
     event_id: Optional[str]
     create_time: Optional[str]
@@ -281,11 +243,11 @@ class P2ApplicationBotMenuV6:
             or _as_optional_str(operator_id.get("user_id")),
             operator_union_id=_as_optional_str(operator.get("union_id"))
             or _as_optional_str(operator_id.get("union_id")),
-            raw=dict(context.payload),
+            raw=context.payload,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class P2CardActionTrigger:
     event_id: Optional[str]
     tenant_key: Optional[str]
@@ -328,11 +290,11 @@ class P2CardActionTrigger:
             trigger_time=_as_optional_str(event.get("action_time"))
             or context.envelope.create_time,
             token=context.envelope.token,
-            raw=dict(context.payload),
+            raw=context.payload,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class P2URLPreviewGet:
     event_id: Optional[str]
     tenant_key: Optional[str]
@@ -360,11 +322,11 @@ class P2URLPreviewGet:
             preview_token=_as_optional_str(details.get("preview_token")),
             open_chat_id=_as_optional_str(details.get("open_chat_id")),
             open_message_id=_as_optional_str(details.get("open_message_id")),
-            raw=dict(context.payload),
+            raw=context.payload,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class P1CustomizedEvent:
     event_type: str
     event_id: Optional[str]
@@ -386,12 +348,17 @@ class P1CustomizedEvent:
             app_id=context.envelope.app_id,
             ts=context.envelope.create_time,
             event=dict(event),
-            raw=dict(context.payload),
+            raw=context.payload,
         )
 
 
-@dataclass(frozen=True)
-class P2DriveFileBitableRecordChangedV1:
+_BitableChangedT = TypeVar("_BitableChangedT", bound="_P2DriveFileBitableChangedV1")
+
+
+# Record and field change events carry the same payload shape; they stay distinct types so
+# handlers and isinstance checks can tell them apart.
+@dataclass(frozen=True, slots=True)
+class _P2DriveFileBitableChangedV1:
     event_id: Optional[str]
     create_time: Optional[str]
     tenant_key: Optional[str]
@@ -409,7 +376,7 @@ class P2DriveFileBitableRecordChangedV1:
     raw: Mapping[str, Any] = field(default_factory=dict)
 
     @classmethod
-    def from_context(cls, context: EventContext) -> "P2DriveFileBitableRecordChangedV1":
+    def from_context(cls: type[_BitableChangedT], context: EventContext) -> _BitableChangedT:
         event = _as_mapping(context.event)
         operator = _as_mapping(event.get("operator_id"))
         return cls(
@@ -427,46 +394,15 @@ class P2DriveFileBitableRecordChangedV1:
             action_list=_as_mapping_list(event.get("action_list")),
             subscriber_id_list=_as_mapping_list(event.get("subscriber_id_list")),
             update_time=_as_optional_int(event.get("update_time")),
-            raw=dict(context.payload),
+            raw=context.payload,
         )
 
 
-@dataclass(frozen=True)
-class P2DriveFileBitableFieldChangedV1:
-    event_id: Optional[str]
-    create_time: Optional[str]
-    tenant_key: Optional[str]
-    app_id: Optional[str]
-    file_type: Optional[str]
-    file_token: Optional[str]
-    table_id: Optional[str]
-    revision: Optional[int]
-    operator_union_id: Optional[str]
-    operator_user_id: Optional[str]
-    operator_open_id: Optional[str]
-    action_list: list[Mapping[str, Any]] = field(default_factory=list)
-    subscriber_id_list: list[Mapping[str, Any]] = field(default_factory=list)
-    update_time: Optional[int] = None
-    raw: Mapping[str, Any] = field(default_factory=dict)
+@dataclass(frozen=True, slots=True)
+class P2DriveFileBitableRecordChangedV1(_P2DriveFileBitableChangedV1):
+    pass
 
-    @classmethod
-    def from_context(cls, context: EventContext) -> "P2DriveFileBitableFieldChangedV1":
-        event = _as_mapping(context.event)
-        operator = _as_mapping(event.get("operator_id"))
-        return cls(
-            event_id=context.envelope.event_id,
-            create_time=context.envelope.create_time,
-            tenant_key=context.envelope.tenant_key,
-            app_id=context.envelope.app_id,
-            file_type=_as_optional_str(event.get("file_type")),
-            file_token=_as_optional_str(event.get("file_token")),
-            table_id=_as_optional_str(event.get("table_id")),
-            revision=_as_optional_int(event.get("revision")),
-            operator_union_id=_as_optional_str(operator.get("union_id")),
-            operator_user_id=_as_optional_str(operator.get("user_id")),
-            operator_open_id=_as_optional_str(operator.get("open_id")),
-            action_list=_as_mapping_list(event.get("action_list")),
-            subscriber_id_list=_as_mapping_list(event.get("subscriber_id_list")),
-            update_time=_as_optional_int(event.get("update_time")),
-            raw=dict(context.payload),
-        )
+
+@dataclass(frozen=True, slots=True)
+class P2DriveFileBitableFieldChangedV1(_P2DriveFileBitableChangedV1):
+    pass
@@ -1,7 +1,6 @@
-import inspect
 from typing import Any, Awaitable, Callable, TypeVar
 
-from .handlers import EventHandlerRegistry
+from .handlers import EventHandlerRegistry, is_async_handler
 from .models import (
     P1CustomizedEvent,
     P2ApplicationBotMenuV6,
@@ -19,121 +18,95 @@ from .types import EventContext
 
 TModel = TypeVar("TModel")
 
+_TYPED_EVENT_PARSERS: dict[str, Callable[[EventContext], Any]] = {
+    "im.message.receive_v1": P2ImMessageReceiveV1.from_context,
+    "im.message.message_read_v1": P2ImMessageReadV1.from_context,
+    "im.message.recalled_v1": P2ImMessageRecalledV1.from_context,
+    "im.message.reaction.created_v1": P2ImMessageReactionCreatedV1.from_context,
+    "im.message.reaction.deleted_v1": P2ImMessageReactionDeletedV1.from_context,
+    "application.bot.menu_v6": P2ApplicationBotMenuV6.from_context,
+    "card.action.trigger": P2CardActionTrigger.from_context,
+    "url.preview.get": P2URLPreviewGet.from_context,
+    "drive.file.bitable_record_changed_v1": P2DriveFileBitableRecordChangedV1.from_context,
+    "drive.file.bitable_field_changed_v1": P2DriveFileBitableFieldChangedV1.from_context,
+}
+
 
 class FeishuEventRegistry(EventHandlerRegistry):
     def on_im_message_receive(
         self,
         handler: Callable[[P2ImMessageReceiveV1], Any] | Callable[[P2ImMessageReceiveV1], Awaitable[Any]],
     ) -> "FeishuEventRegistry":
-        self._register_typed(
-            "im.message.receive_v1",
-            P2ImMessageReceiveV1.from_context,
-            handler,
-        )
-        return self
+        return self.on_typed("im.message.receive_v1", handler)
 
     def on_im_message_read(
         self,
         handler: Callable[[P2ImMessageReadV1], Any] | Callable[[P2ImMessageReadV1], Awaitable[Any]],
     ) -> "FeishuEventRegistry":
-        self._register_typed(
-            "im.message.message_read_v1",
-            P2ImMessageReadV1.from_context,
-            handler,
-        )
-        return self
+        return self.on_typed("im.message.message_read_v1", handler)
 
     def on_im_message_recalled(
         self,
         handler: Callable[[P2ImMessageRecalledV1], Any]
         | Callable[[P2ImMessageRecalledV1], Awaitable[Any]],
     ) -> "FeishuEventRegistry":
-        self._register_typed(
-            "im.message.recalled_v1",
-            P2ImMessageRecalledV1.from_context,
-            handler,
-        )
-        return self
+        return self.on_typed("im.message.recalled_v1", handler)
 
     def on_im_message_reaction_created(
         self,
         handler: Callable[[P2ImMessageReactionCreatedV1], Any]
         | Callable[[P2ImMessageReactionCreatedV1], Awaitable[Any]],
     ) -> "FeishuEventRegistry":
-        self._register_typed(
-            "im.message.reaction.created_v1",
-            P2ImMessageReactionCreatedV1.from_context,
-            handler,
-        )
-        return self
+        return self.on_typed("im.message.reaction.created_v1", handler)
 
     def on_im_message_reaction_deleted(
         self,
         handler: Callable[[P2ImMessageReactionDeletedV1], Any]
         | Callable[[P2ImMessageReactionDeletedV1], Awaitable[Any]],
     ) -> "FeishuEventRegistry":
-        self._register_typed(
-            "im.message.reaction.deleted_v1",
-            P2ImMessageReactionDeletedV1.from_context,
-            handler,
-        )
-        return self
+        return self.on_typed("im.message.reaction.deleted_v1", handler)
 
     def on_bot_menu(
         self,
         handler: Callable[[P2ApplicationBotMenuV6], Any] | Callable[[P2ApplicationBotMenuV6], Awaitable[Any]],
     ) -> "FeishuEventRegistry":
-        self._register_typed(
-            "application.bot.menu_v6",
-            P2ApplicationBotMenuV6.from_context,
-            handler,
-        )
-        return self
+        return self.on_typed("application.bot.menu_v6", handler)
 
     def on_card_action_trigger(
         self,
         handler: Callable[[P2CardActionTrigger], Any] | Callable[[P2CardActionTrigger], Awaitable[Any]],
     ) -> "FeishuEventRegistry":
-        self._register_typed(
-            "card.action.trigger",
-            P2CardActionTrigger.from_context,
-            handler,
-        )
-        return self
+        return self.on_typed("card.action.trigger", handler)
 
     def on_url_preview_get(
         self,
         handler: Callable[[P2URLPreviewGet], Any] | Callable[[P2URLPreviewGet], Awaitable[Any]],
     ) -> "FeishuEventRegistry":
-        self._register_typed(
-            "url.preview.get",
-            P2URLPreviewGet.from_context,
-            handler,
-        )
-        return self
+        return self.on_typed("url.preview.get", handler)
 
     def on_bitable_record_changed(
         self,
         handler: Callable[[P2DriveFileBitableRecordChangedV1], Any]
         | Callable[[P2DriveFileBitableRecordChangedV1], Awaitable[Any]],
     ) -> "FeishuEventRegistry":
-        self._register_typed(
-            "drive.file.bitable_record_changed_v1",
-            P2DriveFileBitableRecordChangedV1.from_context,
-            handler,
-        )
-        return self
+        return self.on_typed("drive.file.bitable_record_changed_v1", handler)
 
     def on_bitable_field_changed(
         self,
         handler: Callable[[P2DriveFileBitableFieldChangedV1], Any]
         | Callable[[P2DriveFileBitableFieldChangedV1], Awaitable[Any]],
     ) -> "FeishuEventRegistry":
-        self._register_typed(
-            "drive.file.bitable_field_changed_v1",
-            P2DriveFileBitableFieldChangedV1.from_context,
-            handler,
-        )
+        return self.on_typed("drive.file.bitable_field_changed_v1", handler)
+
+    def on_typed(
+        self,
+        event_type: str,
+        handler: Callable[[Any], Any] | Callable[[Any], Awaitable[Any]],
+    ) -> "FeishuEventRegistry":
+        parser = _TYPED_EVENT_PARSERS.get(event_type)
+        if parser is None:
+            raise ValueError(f"no typed model for event_type: {event_type}")
+        self._register_typed(event_type, parser, handler)
         return self
 
     def on_p1_customized_event(
@@ -158,16 +131,15 @@ def _wrap_typed_handler(
     parser: Callable[[EventContext], TModel],
     handler: Callable[[TModel], Any] | Callable[[TModel], Awaitable[Any]],
 ):
-    if inspect.iscoroutinefunction(handler):
+    # parser/handler are bound as defaults so each dispatch reads fast locals instead of closure cells.
+    if is_async_handler(handler):
 
-        async def _wrapped(context: EventContext) -> Any:
-            parsed = parser(context)
-            return await handler(parsed)
+        async def _wrapped(context: EventContext, _parser=parser, _handler=handler) -> Any:
+            return await _handler(_parser(context))
 
         return _wrapped
 
-    def _wrapped(context: EventContext) -> Any:
-        parsed = parser(context)
-        return handler(parsed)
+    def _wrapped(context: EventContext, _parser=parser, _handler=handler) -> Any:
+        return _handler(_parser(context))
 
     return _wrapped
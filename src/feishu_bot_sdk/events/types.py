@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import Any, Mapping, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventEnvelope:
     schema: str
     event_type: str
@@ -20,7 +20,7 @@ class EventEnvelope:
         return self.event_type == "url_verification"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventContext:
     envelope: EventEnvelope
     payload: Mapping[str, Any] = field(default_factory=dict)
@@ -1,4 +1,4 @@
-from typing import Mapping, Optional
+from typing import Any, Dict, Mapping, Optional
 
 
 class SDKError(RuntimeError):
@@ -21,8 +21,27 @@ class HTTPRequestError(SDKError):
         super().__init__(message)
         self.status_code = status_code
         self.response_text = response_text
-        self.response_headers = dict(response_headers or {})
+        # Most errors are raised and logged without anyone reading the headers, so the copy is deferred.
+        self._raw_response_headers = response_headers
+        self._response_headers: Optional[Dict[str, str]] = None
+
+    @property
+    def response_headers(self) -> Dict[str, str]:
+        if self._response_headers is None:
+            self._response_headers = dict(self._raw_response_headers or {})
+        return self._response_headers
+
+    @response_headers.setter
+    def response_headers(self, value: Mapping[str, str]) -> None:
+        self._raw_response_headers = value
+        self._response_headers = None
 
 
 class FeishuError(SDKError):
     pass
+
+
+class TaskTimeoutError(FeishuError):
+    def __init__(self, message: str, *, last_payload: Optional[Mapping[str, Any]] = None) -> None:
+        super().__init__(message)
+        self.last_payload = last_payload
@@ -1,11 +1,17 @@
 import asyncio
+import functools
 import json
+import re
+import sys
 import threading
 import time
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any, Callable, Dict, Mapping, Optional
 from urllib.parse import urlencode
 
+import httpx
+
 from .config import FeishuConfig
 from .exceptions import ConfigurationError, FeishuError, HTTPRequestError
 from .http_client import AsyncJsonHttpClient, JsonHttpClient
@@ -17,7 +23,7 @@ from .rate_limit import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class OAuthUserToken:
     access_token: str
     token_type: str
@@ -47,7 +53,7 @@ class OAuthUserToken:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class OAuthUserInfo:
     open_id: Optional[str]
     user_id: Optional[str]
@@ -75,13 +81,19 @@ class OAuthUserInfo:
         }
 
 
-@dataclass
+_TOKEN_REFRESH_SKEW_SECONDS = 30
+_EXPLICIT_AUTH_MODES = frozenset({"tenant", "user"})
+
+
+@dataclass(frozen=True, slots=True)
 class _TokenCache:
+    # refresh_at is on the time.monotonic() clock and already includes the refresh skew, so a
+    # cache hit is one clock read and one compare.
     token: str
-    expires_at: float
+    refresh_at: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _UserTokenCache:
     access_token: str
     expires_at: float
@@ -99,15 +111,30 @@ class FeishuClient:
         on_user_token_updated: Optional[Callable[[OAuthUserToken], None]] = None,
     ) -> None:
         self._config = config
-        self._http = http_client or JsonHttpClient(timeout_seconds=config.timeout_seconds)
+        self._http = http_client or JsonHttpClient(
+            timeout_seconds=config.timeout_seconds,
+            http2=config.http2_enabled,
+            limits=_build_http_limits(config),
+        )
         self._rate_limiter = rate_limiter or _build_default_rate_limiter(config)
         self._app_token_cache: Optional[_TokenCache] = None
         self._tenant_token_cache: Optional[_TokenCache] = None
         self._user_token_cache: Optional[_UserTokenCache] = _initial_user_token_cache(config)
+        # Auth headers per live token; replaced whenever a token is refreshed so rotated secrets are dropped.
+        self._auth_headers: dict[str, tuple[Mapping[str, str], Mapping[str, str]]] = {}
         self._app_token_lock = threading.Lock()
         self._tenant_token_lock = threading.Lock()
         self._user_token_lock = threading.Lock()
         self._on_user_token_updated = on_user_token_updated
+        # FeishuConfig is frozen, so the normalised auth mode and urls derived from base_url are
+        # computed once per client instead of on every request.
+        self._auth_mode = (config.auth_mode or "tenant").strip().lower()
+        self._fixed_auth_modes: Optional[list[str]] = (
+            [self._auth_mode] if self._auth_mode in _EXPLICIT_AUTH_MODES else None
+        )
+        self._authorize_url = f"{_derive_open_domain(config.base_url)}/open-apis/authen/v1/authorize"
+        self._app_token_url = f"{config.base_url}/auth/v3/app_access_token/internal"
+        self._tenant_token_url = f"{config.base_url}/auth/v3/tenant_access_token/internal"
 
     @property
     def config(self) -> FeishuConfig:
@@ -120,12 +147,13 @@ class FeishuClient:
         static_token = self._config.app_access_token
         if static_token:
             return static_token
+        now = time.monotonic()
         cached = self._app_token_cache
-        if cached and cached.expires_at > time.time() + 30:
+        if cached and cached.refresh_at > now:
             return cached.token
         with self._app_token_lock:
             cached = self._app_token_cache
-            if cached and cached.expires_at > time.time() + 30:
+            if cached and cached.refresh_at > now:
                 return cached.token
             token = self._refresh_app_access_token()
             return token
@@ -153,8 +181,7 @@ class FeishuClient:
         if code_challenge:
             query["code_challenge"] = code_challenge
             query["code_challenge_method"] = code_challenge_method or "S256"
-        base_open_domain = _derive_open_domain(self._config.base_url)
-        return f"{base_open_domain}/open-apis/authen/v1/authorize?{urlencode(query)}"
+        return f"{self._authorize_url}?{urlencode(query)}"
 
     def exchange_authorization_code(
         self,
@@ -220,7 +247,7 @@ class FeishuClient:
                 raise
             break
         payload = data.get("data")
-        if not isinstance(payload, Mapping):
+        if type(payload) is not dict and not isinstance(payload, Mapping):
             payload = {}
         return _parse_user_info(payload)
 
@@ -228,10 +255,9 @@ class FeishuClient:
         payload = {
             "receive_id": receive_id,
             "msg_type": "text",
-            "content": json.dumps({"text": text}, ensure_ascii=False),
+            "content": _text_content(text),
         }
-        self.request_json(
-            "POST",
+        self._post_json(
             "/im/v1/messages",
             payload=payload,
             params={"receive_id_type": receive_id_type},
@@ -245,37 +271,58 @@ class FeishuClient:
         payload: Optional[Mapping[str, object]] = None,
         params: Optional[Mapping[str, object]] = None,
     ) -> Dict[str, Any]:
-        method_upper = method.upper()
-        url = _build_openapi_url(self._config.base_url, path)
-        query_params = dict(params or {})
-        json_payload = dict(payload) if payload is not None else None
+        method_upper, url, key = _prepare_request(method, self._config.base_url, path)
+        # The http clients copy params and payload before sending, so caller mappings pass through as-is.
+        query_params: Mapping[str, object] = params or _EMPTY_PARAMS
+        json_payload = payload
         if method_upper == "GET" and not query_params:
-            query_params = dict(json_payload or {})
+            query_params = json_payload or _EMPTY_PARAMS
             json_payload = None
-        key = build_rate_limit_key(method_upper, path)
+        return self._send_json(method_upper, path, url, key, query_params, json_payload)
+
+    def _post_json(
+        self,
+        path: str,
+        *,
+        payload: Mapping[str, object],
+        params: Optional[Mapping[str, object]] = None,
+    ) -> Dict[str, Any]:
+        method_upper, url, key = _prepare_request("POST", self._config.base_url, path)
+        return self._send_json(method_upper, path, url, key, params or _EMPTY_PARAMS, payload)
+
+    def _send_json(
+        self,
+        method_upper: str,
+        path: str,
+        url: str,
+        key: str,
+        query_params: Mapping[str, object],
+        json_payload: Optional[Mapping[str, object]],
+    ) -> Dict[str, Any]:
+        rate_limiter = self._rate_limiter
+        request_http_json = self._http.request_json
+        timeout_seconds = self._config.timeout_seconds
         auth_modes = self._request_auth_modes_for_path(path)
         last_error: Exception | None = None
         for index, auth_mode in enumerate(auth_modes):
             refreshed_once = False
             while True:
                 token = self._resolve_access_token_for_mode(auth_mode)
-                headers = {"Authorization": f"Bearer {token}"}
-                if method_upper != "GET":
-                    headers["Content-Type"] = "application/json"
-                if self._rate_limiter is not None:
-                    self._rate_limiter.acquire(key)
+                headers = self._authorization_headers(token, method_upper != "GET")
+                if rate_limiter is not None:
+                    rate_limiter.acquire(key)
                 try:
-                    data = self._http.request_json(
+                    data = request_http_json(
                         method_upper,
                         url,
                         headers=headers,
                         params=query_params,
                         payload=json_payload,
-                        timeout_seconds=self._config.timeout_seconds,
+                        timeout_seconds=timeout_seconds,
                     )
                 except HTTPRequestError as exc:
-                    if self._rate_limiter is not None and exc.status_code == 429:
-                        self._rate_limiter.on_throttled(key, _extract_retry_after(exc.response_headers))
+                    if rate_limiter is not None and exc.status_code == 429:
+                        rate_limiter.on_throttled(key, _extract_retry_after(exc.response_headers))
                     if (
                         not refreshed_once
                         and auth_mode == "user"
@@ -293,8 +340,8 @@ class FeishuClient:
                         break
                     raise
                 if data.get("code") != 0:
-                    if self._rate_limiter is not None and _is_throttled_response(data):
-                        self._rate_limiter.on_throttled(key)
+                    if rate_limiter is not None and _is_throttled_response(data):
+                        rate_limiter.on_throttled(key)
                     if (
                         not refreshed_once
                         and auth_mode == "user"
@@ -312,8 +359,8 @@ class FeishuClient:
                         last_error = error
                         break
                     raise error
-                if self._rate_limiter is not None:
-                    self._rate_limiter.on_success(key)
+                if rate_limiter is not None:
+                    rate_limiter.on_success(key)
                 return data
         if last_error is not None:
             raise last_error
@@ -328,34 +375,35 @@ class FeishuClient:
         files: Optional[Mapping[str, tuple[str, bytes, str]]] = None,
         params: Optional[Mapping[str, object]] = None,
     ) -> Dict[str, Any]:
-        method_upper = method.upper()
-        url = _build_openapi_url(self._config.base_url, path)
-        query_params = dict(params or {})
-        form_data = dict(data or {})
-        multipart_files = dict(files or {})
-        key = build_rate_limit_key(method_upper, path)
+        method_upper, url, key = _prepare_request(method, self._config.base_url, path)
+        rate_limiter = self._rate_limiter
+        request_http_json = self._http.request_json
+        timeout_seconds = self._config.timeout_seconds
+        query_params = params or _EMPTY_PARAMS
+        form_data = data or _EMPTY_PARAMS
+        multipart_files = files or {}
         auth_modes = self._request_auth_modes_for_path(path)
         last_error: Exception | None = None
         for index, auth_mode in enumerate(auth_modes):
             refreshed_once = False
             while True:
                 token = self._resolve_access_token_for_mode(auth_mode)
-                headers = {"Authorization": f"Bearer {token}"}
-                if self._rate_limiter is not None:
-                    self._rate_limiter.acquire(key)
+                headers = self._authorization_headers(token, False)
+                if rate_limiter is not None:
+                    rate_limiter.acquire(key)
                 try:
-                    response = self._http.request_json(
+                    response = request_http_json(
                         method_upper,
                         url,
                         headers=headers,
                         params=query_params,
                         data=form_data,
                         files=multipart_files,
-                        timeout_seconds=self._config.timeout_seconds,
+                        timeout_seconds=timeout_seconds,
                     )
                 except HTTPRequestError as exc:
-                    if self._rate_limiter is not None and exc.status_code == 429:
-                        self._rate_limiter.on_throttled(key, _extract_retry_after(exc.response_headers))
+                    if rate_limiter is not None and exc.status_code == 429:
+                        rate_limiter.on_throttled(key, _extract_retry_after(exc.response_headers))
                     if (
                         not refreshed_once
                         and auth_mode == "user"
@@ -373,8 +421,8 @@ class FeishuClient:
                         break
                     raise
                 if response.get("code") != 0:
-                    if self._rate_limiter is not None and _is_throttled_response(response):
-                        self._rate_limiter.on_throttled(key)
+                    if rate_limiter is not None and _is_throttled_response(response):
+                        rate_limiter.on_throttled(key)
                     if (
                         not refreshed_once
                         and auth_mode == "user"
@@ -392,31 +440,42 @@ class FeishuClient:
                         last_error = error
                         break
                     raise error
-                if self._rate_limiter is not None:
-                    self._rate_limiter.on_success(key)
+                if rate_limiter is not None:
+                    rate_limiter.on_success(key)
                 return response
         if last_error is not None:
             raise last_error
         raise ConfigurationError("no Feishu auth mode available for this request")
 
+    def close(self) -> None:
+        self._http.close()
+
+    def _authorization_headers(self, token: str, json_body: bool) -> Mapping[str, str]:
+        headers = self._auth_headers.get(token)
+        if headers is None:
+            headers = self._auth_headers[token] = _build_authorization_headers(token)
+        return headers[1] if json_body else headers[0]
+
     def _resolve_access_token(self) -> str:
         return self._resolve_access_token_for_mode(self._default_access_token_mode())
 
     def _resolve_access_token_for_mode(self, auth_mode: str) -> str:
-        normalized_mode = str(auth_mode or "").strip().lower()
+        normalized_mode = auth_mode
+        if normalized_mode not in _EXPLICIT_AUTH_MODES:
+            normalized_mode = str(auth_mode or "").strip().lower()
         if normalized_mode == "tenant":
             if self._config.access_token:
                 return self._config.access_token
             return self._resolve_tenant_access_token()
         if normalized_mode == "user":
-            if (self._config.auth_mode or "").strip().lower() == "user" and self._config.access_token:
+            if self._auth_mode == "user" and self._config.access_token:
                 return self._config.access_token
             return self._resolve_user_access_token()
         raise ConfigurationError("auth_mode must be either 'tenant', 'user', or 'auto'")
 
     def _default_access_token_mode(self) -> str:
-        auth_mode = (self._config.auth_mode or "tenant").strip().lower()
-        if auth_mode in {"tenant", "user"}:
+        auth_mode = self._auth_mode
+        if auth_mode in _EXPLICIT_AUTH_MODES:
             return auth_mode
         if self._has_tenant_auth():
             return "tenant"
@@ -425,9 +484,8 @@ class FeishuClient:
         raise ConfigurationError("auto mode requires tenant credentials or user token")
 
     def _request_auth_modes_for_path(self, path: str) -> list[str]:
-        auth_mode = (self._config.auth_mode or "tenant").strip().lower()
-        if auth_mode in {"tenant", "user"}:
-            return [auth_mode]
+        if self._fixed_auth_modes is not None:
+            return self._fixed_auth_modes
         preferred = _preferred_auth_mode_for_path(path)
         alternate = "tenant" if preferred == "user" else "user"
         ordered = [preferred, alternate]
@@ -448,16 +506,17 @@ class FeishuClient:
         return bool(
             self._config.user_access_token
             or self._config.user_refresh_token
-            or ((self._config.auth_mode or "").strip().lower() == "user" and self._config.access_token)
+            or (self._auth_mode == "user" and self._config.access_token)
         )
 
     def _resolve_tenant_access_token(self) -> str:
+        now = time.monotonic()
         cached = self._tenant_token_cache
-        if cached and cached.expires_at > time.time() + 30:
+        if cached and cached.refresh_at > now:
             return cached.token
         with self._tenant_token_lock:
             cached = self._tenant_token_cache
-            if cached and cached.expires_at > time.time() + 30:
+            if cached and cached.refresh_at > now:
                 return cached.token
             token = self._refresh_tenant_access_token()
             return token
@@ -485,42 +544,28 @@ class FeishuClient:
             return self.refresh_user_access_token()
 
     def _refresh_app_access_token(self) -> str:
-        if not self._config.app_id or not self._config.app_secret:
-            raise ConfigurationError("app_id/app_secret is required to refresh app_access_token")
-        url = f"{self._config.base_url}/auth/v3/app_access_token/internal"
-        data = self._http.request_json(
-            "POST",
-            url,
-            payload={"app_id": self._config.app_id, "app_secret": self._config.app_secret},
-            timeout_seconds=self._config.timeout_seconds,
-        )
-        if data.get("code") != 0:
-            raise FeishuError(f"feishu app token failed: {data}")
-        token = data.get("app_access_token")
-        if not isinstance(token, str) or not token:
-            raise FeishuError("feishu app token missing app_access_token")
-        expires_in = int(data.get("expire") or 7200)
-        self._app_token_cache = _TokenCache(token=token, expires_at=time.time() + expires_in)
-        return token
+        data = self._fetch_app_credential_token(self._app_token_url, "app_access_token")
+        cache = _parse_token_cache(data, kind="app")
+        self._app_token_cache = cache
+        self._auth_headers = {}
+        return cache.token
 
     def _refresh_tenant_access_token(self) -> str:
+        data = self._fetch_app_credential_token(self._tenant_token_url, "tenant-mode access token")
+        cache = _parse_token_cache(data, kind="tenant")
+        self._tenant_token_cache = cache
+        self._auth_headers = {}
+        return cache.token
+
+    def _fetch_app_credential_token(self, url: str, token_name: str) -> Dict[str, Any]:
         if not self._config.app_id or not self._config.app_secret:
-            raise ConfigurationError("app_id/app_secret is required to refresh tenant-mode access token")
-        url = f"{self._config.base_url}/auth/v3/tenant_access_token/internal"
-        data = self._http.request_json(
+            raise ConfigurationError(f"app_id/app_secret is required to refresh {token_name}")
+        return self._http.request_json(
             "POST",
             url,
             payload={"app_id": self._config.app_id, "app_secret": self._config.app_secret},
             timeout_seconds=self._config.timeout_seconds,
         )
-        if data.get("code") != 0:
-            raise FeishuError(f"feishu tenant token failed: {data}")
-        token = data.get("tenant_access_token")
-        if not isinstance(token, str) or not token:
-            raise FeishuError("feishu tenant token response missing tenant_access_token")
-        expires_in = int(data.get("expire") or 7200)
-        self._tenant_token_cache = _TokenCache(token=token, expires_at=time.time() + expires_in)
-        return token
 
     def _request_with_app_access_token(
         self,
@@ -548,17 +593,15 @@ class FeishuClient:
         params: Optional[Mapping[str, object]] = None,
         bearer_token: str,
     ) -> Dict[str, Any]:
-        method_upper = method.upper()
-        url = _build_openapi_url(self._config.base_url, path)
-        headers = {"Authorization": f"Bearer {bearer_token}"}
-        if method_upper != "GET":
-            headers["Content-Type"] = "application/json"
+        method_upper, url, _ = _prepare_request(method, self._config.base_url, path)
+        plain_headers, json_headers = _build_authorization_headers(bearer_token)
+        headers = json_headers if method_upper != "GET" else plain_headers
         data = self._http.request_json(
             method_upper,
             url,
             headers=headers,
-            params=dict(params or {}),
-            payload=dict(payload) if payload is not None else None,
+            params=params or _EMPTY_PARAMS,
+            payload=payload,
             timeout_seconds=self._config.timeout_seconds,
         )
         if data.get("code") != 0:
@@ -576,6 +619,7 @@ class FeishuClient:
             refresh_token=token.refresh_token,
             refresh_expires_at=refresh_expires_at,
         )
+        self._auth_headers = {}
         callback = self._on_user_token_updated
         if callback is not None:
             callback(token)
@@ -591,15 +635,30 @@ class AsyncFeishuClient:
         on_user_token_updated: Optional[Callable[[OAuthUserToken], None]] = None,
     ) -> None:
         self._config = config
-        self._http = http_client or AsyncJsonHttpClient(timeout_seconds=config.timeout_seconds)
+        self._http = http_client or AsyncJsonHttpClient(
+            timeout_seconds=config.timeout_seconds,
+            http2=config.http2_enabled,
+            limits=_build_http_limits(config),
+        )
         self._rate_limiter = rate_limiter or _build_default_async_rate_limiter(config)
         self._app_token_cache: Optional[_TokenCache] = None
         self._tenant_token_cache: Optional[_TokenCache] = None
         self._user_token_cache: Optional[_UserTokenCache] = _initial_user_token_cache(config)
+        # Auth headers per live token; replaced whenever a token is refreshed so rotated secrets are dropped.
+        self._auth_headers: dict[str, tuple[Mapping[str, str], Mapping[str, str]]] = {}
         self._app_token_lock = asyncio.Lock()
         self._tenant_token_lock = asyncio.Lock()
         self._user_token_lock = asyncio.Lock()
         self._on_user_token_updated = on_user_token_updated
+        # FeishuConfig is frozen, so the normalised auth mode and urls derived from base_url are
+        # computed once per client instead of on every request.
+        self._auth_mode = (config.auth_mode or "tenant").strip().lower()
+        self._fixed_auth_modes: Optional[list[str]] = (
+            [self._auth_mode] if self._auth_mode in _EXPLICIT_AUTH_MODES else None
+        )
+        self._authorize_url = f"{_derive_open_domain(config.base_url)}/open-apis/authen/v1/authorize"
+        self._app_token_url = f"{config.base_url}/auth/v3/app_access_token/internal"
+        self._tenant_token_url = f"{config.base_url}/auth/v3/tenant_access_token/internal"
 
     @property
     def config(self) -> FeishuConfig:
@@ -612,12 +671,13 @@ class AsyncFeishuClient:
         static_token = self._config.app_access_token
         if static_token:
             return static_token
+        now = time.monotonic()
         cached = self._app_token_cache
-        if cached and cached.expires_at > time.time() + 30:
+        if cached and cached.refresh_at > now:
             return cached.token
         async with self._app_token_lock:
             cached = self._app_token_cache
-            if cached and cached.expires_at > time.time() + 30:
+            if cached and cached.refresh_at > now:
                 return cached.token
             token = await self._refresh_app_access_token()
             return token
@@ -645,8 +705,7 @@ class AsyncFeishuClient:
         if code_challenge:
             query["code_challenge"] = code_challenge
             query["code_challenge_method"] = code_challenge_method or "S256"
-        base_open_domain = _derive_open_domain(self._config.base_url)
-        return f"{base_open_domain}/open-apis/authen/v1/authorize?{urlencode(query)}"
+        return f"{self._authorize_url}?{urlencode(query)}"
 
     async def exchange_authorization_code(
         self,
@@ -712,7 +771,7 @@ class AsyncFeishuClient:
                 raise
             break
         payload = data.get("data")
-        if not isinstance(payload, Mapping):
+        if type(payload) is not dict and not isinstance(payload, Mapping):
             payload = {}
         return _parse_user_info(payload)
 
@@ -720,10 +779,9 @@ class AsyncFeishuClient:
         payload = {
             "receive_id": receive_id,
             "msg_type": "text",
-            "content": json.dumps({"text": text}, ensure_ascii=False),
+            "content": _text_content(text),
         }
-        await self.request_json(
-            "POST",
+        await self._post_json(
             "/im/v1/messages",
             payload=payload,
             params={"receive_id_type": receive_id_type},
@@ -737,37 +795,58 @@ class AsyncFeishuClient:
         payload: Optional[Mapping[str, object]] = None,
         params: Optional[Mapping[str, object]] = None,
     ) -> Dict[str, Any]:
-        method_upper = method.upper()
-        url = _build_openapi_url(self._config.base_url, path)
-        query_params = dict(params or {})
-        json_payload = dict(payload) if payload is not None else None
+        method_upper, url, key = _prepare_request(method, self._config.base_url, path)
+        # The http clients copy params and payload before sending, so caller mappings pass through as-is.
+        query_params: Mapping[str, object] = params or _EMPTY_PARAMS
+        json_payload = payload
         if method_upper == "GET" and not query_params:
-            query_params = dict(json_payload or {})
+            query_params = json_payload or _EMPTY_PARAMS
             json_payload = None
-        key = build_rate_limit_key(method_upper, path)
+        return await self._send_json(method_upper, path, url, key, query_params, json_payload)
+
+    async def _post_json(
+        self,
+        path: str,
+        *,
+        payload: Mapping[str, object],
+        params: Optional[Mapping[str, object]] = None,
+    ) -> Dict[str, Any]:
+        method_upper, url, key = _prepare_request("POST", self._config.base_url, path)
+        return await self._send_json(method_upper, path, url, key, params or _EMPTY_PARAMS, payload)
+
+    async def _send_json(
+        self,
+        method_upper: str,
+        path: str,
+        url: str,
+        key: str,
+        query_params: Mapping[str, object],
+        json_payload: Optional[Mapping[str, object]],
+    ) -> Dict[str, Any]:
+        rate_limiter = self._rate_limiter
+        request_http_json = self._http.request_json
+        timeout_seconds = self._config.timeout_seconds
         auth_modes = self._request_auth_modes_for_path(path)
         last_error: Exception | None = None
         for index, auth_mode in enumerate(auth_modes):
             refreshed_once = False
             while True:
                 token = await self._resolve_access_token_for_mode(auth_mode)
-                headers = {"Authorization": f"Bearer {token}"}
-                if method_upper != "GET":
-                    headers["Content-Type"] = "application/json"
-                if self._rate_limiter is not None:
-                    await self._rate_limiter.acquire(key)
+                headers = self._authorization_headers(token, method_upper != "GET")
+                if rate_limiter is not None:
+                    await rate_limiter.acquire(key)
                 try:
-                    data = await self._http.request_json(
+                    data = await request_http_json(
                         method_upper,
                         url,
                         headers=headers,
                         params=query_params,
                         payload=json_payload,
-                        timeout_seconds=self._config.timeout_seconds,
+                        timeout_seconds=timeout_seconds,
                     )
                 except HTTPRequestError as exc:
-                    if self._rate_limiter is not None and exc.status_code == 429:
-                        await self._rate_limiter.on_throttled(key, _extract_retry_after(exc.response_headers))
+                    if rate_limiter is not None and exc.status_code == 429:
+                        await rate_limiter.on_throttled(key, _extract_retry_after(exc.response_headers))
                     if (
                         not refreshed_once
                         and auth_mode == "user"
@@ -785,8 +864,8 @@ class AsyncFeishuClient:
                         break
                     raise
                 if data.get("code") != 0:
-                    if self._rate_limiter is not None and _is_throttled_response(data):
-                        await self._rate_limiter.on_throttled(key)
+                    if rate_limiter is not None and _is_throttled_response(data):
+                        await rate_limiter.on_throttled(key)
                     if (
                         not refreshed_once
                         and auth_mode == "user"
@@ -804,8 +883,8 @@ class AsyncFeishuClient:
                         last_error = error
                         break
                     raise error
-                if self._rate_limiter is not None:
-                    await self._rate_limiter.on_success(key)
+                if rate_limiter is not None:
+                    await rate_limiter.on_success(key)
                 return data
         if last_error is not None:
             raise last_error
@@ -814,24 +893,32 @@ class AsyncFeishuClient:
     async def aclose(self) -> None:
         await self._http.aclose()
 
+    def _authorization_headers(self, token: str, json_body: bool) -> Mapping[str, str]:
+        headers = self._auth_headers.get(token)
+        if headers is None:
+            headers = self._auth_headers[token] = _build_authorization_headers(token)
+        return headers[1] if json_body else headers[0]
+
     async def _resolve_access_token(self) -> str:
         return await self._resolve_access_token_for_mode(self._default_access_token_mode())
 
     async def _resolve_access_token_for_mode(self, auth_mode: str) -> str:
-        normalized_mode = str(auth_mode or "").strip().lower()
+        normalized_mode = auth_mode
+        if normalized_mode not in _EXPLICIT_AUTH_MODES:
+            normalized_mode = str(auth_mode or "").strip().lower()
         if normalized_mode == "tenant":
             if self._config.access_token:
                 return self._config.access_token
             return await self._resolve_tenant_access_token()
         if normalized_mode == "user":
-            if (self._config.auth_mode or "").strip().lower() == "user" and self._config.access_token:
+            if self._auth_mode == "user" and self._config.access_token:
                 return self._config.access_token
             return await self._resolve_user_access_token()
         raise ConfigurationError("auth_mode must be either 'tenant', 'user', or 'auto'")
 
     def _default_access_token_mode(self) -> str:
-        auth_mode = (self._config.auth_mode or "tenant").strip().lower()
-        if auth_mode in {"tenant", "user"}:
+        auth_mode = self._auth_mode
+        if auth_mode in _EXPLICIT_AUTH_MODES:
             return auth_mode
         if self._has_tenant_auth():
             return "tenant"
@@ -840,9 +927,8 @@ class AsyncFeishuClient:
         raise ConfigurationError("auto mode requires tenant credentials or user token")
 
     def _request_auth_modes_for_path(self, path: str) -> list[str]:
-        auth_mode = (self._config.auth_mode or "tenant").strip().lower()
-        if auth_mode in {"tenant", "user"}:
-            return [auth_mode]
+        if self._fixed_auth_modes is not None:
+            return self._fixed_auth_modes
         preferred = _preferred_auth_mode_for_path(path)
         alternate = "tenant" if preferred == "user" else "user"
         ordered = [preferred, alternate]
@@ -863,16 +949,17 @@ class AsyncFeishuClient:
         return bool(
             self._config.user_access_token
             or self._config.user_refresh_token
-            or ((self._config.auth_mode or "").strip().lower() == "user" and self._config.access_token)
+            or (self._auth_mode == "user" and self._config.access_token)
         )
 
     async def _resolve_tenant_access_token(self) -> str:
+        now = time.monotonic()
         cached = self._tenant_token_cache
-        if cached and cached.expires_at > time.time() + 30:
+        if cached and cached.refresh_at > now:
             return cached.token
         async with self._tenant_token_lock:
             cached = self._tenant_token_cache
-            if cached and cached.expires_at > time.time() + 30:
+            if cached and cached.refresh_at > now:
                 return cached.token
             token = await self._refresh_tenant_access_token()
             return token
@@ -900,42 +987,28 @@ class AsyncFeishuClient:
             return await self.refresh_user_access_token()
 
     async def _refresh_app_access_token(self) -> str:
-        if not self._config.app_id or not self._config.app_secret:
-            raise ConfigurationError("app_id/app_secret is required to refresh app_access_token")
-        url = f"{self._config.base_url}/auth/v3/app_access_token/internal"
-        data = await self._http.request_json(
-            "POST",
-            url,
-            payload={"app_id": self._config.app_id, "app_secret": self._config.app_secret},
-            timeout_seconds=self._config.timeout_seconds,
-        )
-        if data.get("code") != 0:
-            raise FeishuError(f"feishu app token failed: {data}")
-        token = data.get("app_access_token")
-        if not isinstance(token, str) or not token:
-            raise FeishuError("feishu app token missing app_access_token")
-        expires_in = int(data.get("expire") or 7200)
-        self._app_token_cache = _TokenCache(token=token, expires_at=time.time() + expires_in)
-        return token
+        data = await self._fetch_app_credential_token(self._app_token_url, "app_access_token")
+        cache = _parse_token_cache(data, kind="app")
+        self._app_token_cache = cache
+        self._auth_headers = {}
+        return cache.token
 
     async def _refresh_tenant_access_token(self) -> str:
+        data = await self._fetch_app_credential_token(self._tenant_token_url, "tenant-mode access token")
+        cache = _parse_token_cache(data, kind="tenant")
+        self._tenant_token_cache = cache
+        self._auth_headers = {}
+        return cache.token
+
+    async def _fetch_app_credential_token(self, url: str, token_name: str) -> Dict[str, Any]:
         if not self._config.app_id or not self._config.app_secret:
-            raise ConfigurationError("app_id/app_secret is required to refresh tenant-mode access token")
-        url = f"{self._config.base_url}/auth/v3/tenant_access_token/internal"
-        data = await self._http.request_json(
+            raise ConfigurationError(f"app_id/app_secret is required to refresh {token_name}")
+        return await self._http.request_json(
             "POST",
             url,
             payload={"app_id": self._config.app_id, "app_secret": self._config.app_secret},
             timeout_seconds=self._config.timeout_seconds,
         )
-        if data.get("code") != 0:
-            raise FeishuError(f"feishu tenant token failed: {data}")
-        token = data.get("tenant_access_token")
-        if not isinstance(token, str) or not token:
-            raise FeishuError("feishu tenant token response missing tenant_access_token")
-        expires_in = int(data.get("expire") or 7200)
-        self._tenant_token_cache = _TokenCache(token=token, expires_at=time.time() + expires_in)
-        return token
 
     async def _request_with_app_access_token(
         self,
@@ -963,17 +1036,15 @@ class AsyncFeishuClient:
         params: Optional[Mapping[str, object]] = None,
         bearer_token: str,
     ) -> Dict[str, Any]:
-        method_upper = method.upper()
-        url = _build_openapi_url(self._config.base_url, path)
-        headers = {"Authorization": f"Bearer {bearer_token}"}
-        if method_upper != "GET":
-            headers["Content-Type"] = "application/json"
+        method_upper, url, _ = _prepare_request(method, self._config.base_url, path)
+        plain_headers, json_headers = _build_authorization_headers(bearer_token)
+        headers = json_headers if method_upper != "GET" else plain_headers
         data = await self._http.request_json(
             method_upper,
             url,
             headers=headers,
-            params=dict(params or {}),
-            payload=dict(payload) if payload is not None else None,
+            params=params or _EMPTY_PARAMS,
+            payload=payload,
             timeout_seconds=self._config.timeout_seconds,
         )
         if data.get("code") != 0:
@@ -991,6 +1062,7 @@ class AsyncFeishuClient:
             refresh_token=token.refresh_token,
             refresh_expires_at=refresh_expires_at,
         )
+        self._auth_headers = {}
         callback = self._on_user_token_updated
         if callback is not None:
             callback(token)
@@ -1008,6 +1080,14 @@ def _build_rate_tuning(config: FeishuConfig) -> RateLimitTuning:
     )
 
 
+def _build_http_limits(config: FeishuConfig) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=config.http_max_connections,
+        max_keepalive_connections=config.http_max_keepalive_connections,
+        keepalive_expiry=config.http_keepalive_expiry_seconds,
+    )
+
+
 def _build_default_rate_limiter(config: FeishuConfig) -> Optional[AdaptiveRateLimiter]:
     if not config.rate_limit_enabled:
         return None
@@ -1020,31 +1100,33 @@ def _build_default_async_rate_limiter(config: FeishuConfig) -> Optional[AsyncAda
     return AsyncAdaptiveRateLimiter(_build_rate_tuning(config))
 
 
+_THROTTLE_CODES = frozenset({99991663, 99991661, 11232})
+_search_throttle_message = re.compile(r"frequency|too many request|rate limit", re.IGNORECASE).search
+
+
 def _is_throttled_response(data: Mapping[str, object]) -> bool:
     code = data.get("code")
-    if isinstance(code, int) and code in {99991663, 99991661, 11232}:
+    if isinstance(code, int) and code in _THROTTLE_CODES:
         return True
     message = data.get("msg")
     if not isinstance(message, str):
         return False
-    lowered = message.lower()
-    return "frequency" in lowered or "too many request" in lowered or "rate limit" in lowered
+    return _search_throttle_message(message) is not None
 
 
 def _extract_retry_after(headers: Mapping[str, str]) -> Optional[float]:
-    for key, value in headers.items():
-        if key.lower() != "retry-after":
-            continue
-        stripped = value.strip()
-        if not stripped:
-            return None
-        try:
-            seconds = float(stripped)
-        except ValueError:
+    # httpx lowercases header names, so the direct lookups cover real responses; the scan is
+    # only for hand-built mappings with unusual casing.
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    if value is None:
+        value = next((item for key, item in headers.items() if key.lower() == "retry-after"), None)
+        if value is None:
             return None
-        if seconds > 0:
-            return seconds
-    return None
+    try:
+        seconds = float(value.strip())
+    except ValueError:
+        return None
+    return seconds if seconds > 0 else None
 
 
 def _is_token_api_error(data: Mapping[str, object]) -> bool:
@@ -1111,22 +1193,61 @@ def _is_token_feishu_error(exc: FeishuError) -> bool:
 
 
 def _derive_open_domain(base_url: str) -> str:
-    marker = "/open-apis"
-    index = base_url.find(marker)
-    if index >= 0:
-        return base_url[:index]
-    return base_url.rstrip("/")
+    head, marker, _ = base_url.partition("/open-apis")
+    return head if marker else base_url.rstrip("/")
 
 
-def _build_openapi_url(base_url: str, path: str) -> str:
+_EMPTY_PARAMS: Mapping[str, object] = MappingProxyType({})
+
+
+# json.dumps only reuses its cached encoder for default arguments; ensure_ascii=False needs its own.
+_encode_json_string = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _text_content(text: str) -> str:
+    # Only the string needs escaping; wrapping it by hand skips building and encoding a one-key dict.
+    # Printable text without quotes or backslashes encodes to itself, so it skips the encoder too.
+    if text.isprintable() and '"' not in text and "\\" not in text:
+        return '{"text":"' + text + '"}'
+    return '{"text":' + _encode_json_string(text) + "}"
+
+
+def _prepare_request(method: str, base_url: str, path: str) -> tuple[str, str, str]:
+    # Paths usually embed resource ids, so only the method and base_url parts are memoized;
+    # the path is joined per call.
+    method_upper = _normalize_method(method)
+    return method_upper, _build_openapi_url(base_url, path), build_rate_limit_key(method_upper, path)
+
+
+@functools.lru_cache(maxsize=32)
+def _normalize_method(method: str) -> str:
+    return sys.intern(method.upper())
+
+
+@functools.lru_cache(maxsize=8)
+def _openapi_roots(base_url: str) -> tuple[str, str]:
     normalized_base = str(base_url or "").rstrip("/")
+    return normalized_base, _derive_open_domain(normalized_base)
+
+
+def _build_authorization_headers(token: str) -> tuple[Mapping[str, str], Mapping[str, str]]:
+    # (plain, json) header pair; shared between requests, so handed out read-only.
+    authorization = f"Bearer {token}"
+    return (
+        MappingProxyType({"Authorization": authorization}),
+        MappingProxyType({"Authorization": authorization, "Content-Type": "application/json"}),
+    )
+
+
+def _build_openapi_url(base_url: str, path: str) -> str:
     normalized_path = str(path or "").strip()
     if normalized_path.startswith(("http://", "https://")):
         return normalized_path
     if not normalized_path.startswith("/"):
         normalized_path = f"/{normalized_path}"
+    normalized_base, open_domain = _openapi_roots(base_url)
     if normalized_path == "/open-apis" or normalized_path.startswith("/open-apis/"):
-        return f"{_derive_open_domain(normalized_base)}{normalized_path}"
+        return f"{open_domain}{normalized_path}"
     return f"{normalized_base}{normalized_path}"
 
 
@@ -1187,6 +1308,17 @@ def _is_user_access_token_unsupported_http_error(exc: HTTPRequestError | None) -
     return '"code":99991668' in response and "user access token not support" in response
 
 
+def _parse_token_cache(data: Mapping[str, Any], *, kind: str) -> _TokenCache:
+    if data.get("code") != 0:
+        raise FeishuError(f"feishu {kind} token failed: {data}")
+    token_field = f"{kind}_access_token"
+    token = data.get(token_field)
+    if not isinstance(token, str) or not token:
+        raise FeishuError(f"feishu {kind} token response missing {token_field}")
+    expires_in = int(data.get("expire") or 7200)
+    return _TokenCache(token=token, refresh_at=time.monotonic() + expires_in - _TOKEN_REFRESH_SKEW_SECONDS)
+
+
 def _initial_user_token_cache(config: FeishuConfig) -> Optional[_UserTokenCache]:
     if not config.user_access_token:
         return None
@@ -1211,49 +1343,49 @@ def _pick_refresh_token(config: FeishuConfig, cache: Optional[_UserTokenCache])
 
 def _parse_user_token(data: Mapping[str, Any]) -> OAuthUserToken:
     payload = data.get("data")
-    if not isinstance(payload, Mapping):
+    if type(payload) is not dict and not isinstance(payload, Mapping):
         payload = {}
-    access_token = payload.get("access_token")
+    get = payload.get
+    access_token = get("access_token")
     if not isinstance(access_token, str) or not access_token:
         raise FeishuError(f"invalid oauth token response: {data}")
-    token_type = payload.get("token_type")
+    token_type = get("token_type")
     if not isinstance(token_type, str) or not token_type:
         token_type = "Bearer"
-    expires_in = _to_int(payload.get("expires_in"), default=7200)
+    expires_in = _to_int(get("expires_in"), default=7200)
     return OAuthUserToken(
         access_token=access_token,
         token_type=token_type,
         expires_in=expires_in,
-        refresh_token=_to_optional_str(payload.get("refresh_token")),
-        refresh_expires_in=_to_optional_int(payload.get("refresh_expires_in")),
-        open_id=_to_optional_str(payload.get("open_id")),
-        user_id=_to_optional_str(payload.get("user_id")),
-        union_id=_to_optional_str(payload.get("union_id")),
-        tenant_key=_to_optional_str(payload.get("tenant_key")),
-        scope=_to_optional_str(payload.get("scope")),
+        refresh_token=_to_optional_str(get("refresh_token")),
+        refresh_expires_in=_to_optional_int(get("refresh_expires_in")),
+        open_id=_to_optional_str(get("open_id")),
+        user_id=_to_optional_str(get("user_id")),
+        union_id=_to_optional_str(get("union_id")),
+        tenant_key=_to_optional_str(get("tenant_key")),
+        scope=_to_optional_str(get("scope")),
         raw=dict(payload),
     )
 
 
 def _parse_user_info(payload: Mapping[str, Any]) -> OAuthUserInfo:
+    get = payload.get
     return OAuthUserInfo(
-        open_id=_to_optional_str(payload.get("open_id")),
-        user_id=_to_optional_str(payload.get("user_id")),
-        union_id=_to_optional_str(payload.get("union_id")),
-        name=_to_optional_str(payload.get("name")),
-        en_name=_to_optional_str(payload.get("en_name")),
-        avatar_url=_to_optional_str(payload.get("avatar_url")),
-        email=_to_optional_str(payload.get("email")),
-        mobile=_to_optional_str(payload.get("mobile")),
-        tenant_key=_to_optional_str(payload.get("tenant_key")),
+        open_id=_to_optional_str(get("open_id")),
+        user_id=_to_optional_str(get("user_id")),
+        union_id=_to_optional_str(get("union_id")),
+        name=_to_optional_str(get("name")),
+        en_name=_to_optional_str(get("en_name")),
+        avatar_url=_to_optional_str(get("avatar_url")),
+        email=_to_optional_str(get("email")),
+        mobile=_to_optional_str(get("mobile")),
+        tenant_key=_to_optional_str(get("tenant_key")),
         raw=dict(payload),
     )
 
 
 def _to_optional_str(value: Any) -> Optional[str]:
-    if value is None:
-        return None
-    if isinstance(value, str):
+    if value is None or isinstance(value, str):
         return value
     return str(value)
 
@@ -2,8 +2,16 @@ from typing import Any, Dict, Mapping, Optional
 
 import httpx
 
+from ._json import json_loads
 from .exceptions import HTTPRequestError
 
+try:
+    import h2
+except ImportError:  # pragma: no cover
+    h2 = None  # type: ignore[assignment]
+
+_UPPERCASE_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE"})
+
 
 class JsonHttpClient:
     def __init__(
@@ -11,9 +19,14 @@ class JsonHttpClient:
         *,
         timeout_seconds: float = 30.0,
         session: Optional[httpx.Client] = None,
+        http2: bool = False,
+        limits: Optional[httpx.Limits] = None,
     ) -> None:
         self._timeout_seconds = timeout_seconds
-        self._session = session or httpx.Client()
+        self._session = session or httpx.Client(
+            http2=_http2_available(http2),
+            limits=limits or httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
 
     def request_json(
         self,
@@ -27,7 +40,7 @@ class JsonHttpClient:
         files: Optional[Mapping[str, tuple[str, bytes, str]]] = None,
         timeout_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
-        method_upper = method.upper()
+        method_upper = method if method in _UPPERCASE_METHODS else method.upper()
         request_kwargs: dict[str, Any] = {
             "headers": dict(headers or {}),
             "params": dict(params or {}),
@@ -53,16 +66,19 @@ class JsonHttpClient:
                 f"http request failed: {response.status_code}",
                 status_code=response.status_code,
                 response_text=response.text,
-                response_headers=dict(response.headers),
+                response_headers=response.headers,
             )
         try:
-            data = response.json()
+            data = json_loads(response.content)
         except ValueError as exc:
             raise HTTPRequestError("response body is not valid json") from exc
         if not isinstance(data, dict):
             raise HTTPRequestError("response body is not a json object")
         return data
 
+    def close(self) -> None:
+        self._session.close()
+
 
 class AsyncJsonHttpClient:
     def __init__(
@@ -70,9 +86,14 @@ class AsyncJsonHttpClient:
         *,
         timeout_seconds: float = 30.0,
         client: Optional[httpx.AsyncClient] = None,
+        http2: bool = False,
+        limits: Optional[httpx.Limits] = None,
     ) -> None:
         self._timeout_seconds = timeout_seconds
-        self._client = client or httpx.AsyncClient()
+        self._client = client or httpx.AsyncClient(
+            http2=_http2_available(http2),
+            limits=limits or httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
 
     async def request_json(
         self,
@@ -86,7 +107,7 @@ class AsyncJsonHttpClient:
         files: Optional[Mapping[str, tuple[str, bytes, str]]] = None,
         timeout_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
-        method_upper = method.upper()
+        method_upper = method if method in _UPPERCASE_METHODS else method.upper()
         request_kwargs: dict[str, Any] = {
             "headers": dict(headers or {}),
             "params": dict(params or {}),
@@ -112,10 +133,10 @@ class AsyncJsonHttpClient:
                 f"http request failed: {response.status_code}",
                 status_code=response.status_code,
                 response_text=response.text,
-                response_headers=dict(response.headers),
+                response_headers=response.headers,
             )
         try:
-            data = response.json()
+            data = json_loads(response.content)
         except ValueError as exc:
             raise HTTPRequestError("response body is not valid json") from exc
         if not isinstance(data, dict):
@@ -124,3 +145,7 @@ class AsyncJsonHttpClient:
 
     async def aclose(self) -> None:
         await self._client.aclose()
+
+
+def _http2_available(http2: bool) -> bool:
+    return http2 and h2 is not None
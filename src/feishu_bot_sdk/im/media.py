@@ -1,17 +1,30 @@
-import mimetypes
+import asyncio
 import os
+import threading
 from typing import Any, Mapping, Optional
 
 import httpx
 
+from .._files import guess_mime_type, read_file_bytes
+from .._json import json_loads
 from ..exceptions import FeishuError, HTTPRequestError
-from ..feishu import AsyncFeishuClient, FeishuClient
+from ..feishu import AsyncFeishuClient, FeishuClient, _build_http_limits
+from ..http_client import _http2_available
 from ..response import DataResponse
 
 
 class MediaService:
     def __init__(self, feishu_client: FeishuClient) -> None:
         self._client = feishu_client
+        self._http: Optional[httpx.Client] = None
+        self._http_lock = threading.Lock()
+
+    def close(self) -> None:
+        with self._http_lock:
+            http = self._http
+            self._http = None
+        if http is not None:
+            http.close()
 
     def upload_image(
         self,
@@ -122,7 +135,7 @@ class MediaService:
             params=params,
         )
         try:
-            payload = response.json()
+            payload = json_loads(response.content)
         except ValueError as exc:
             raise HTTPRequestError("response body is not valid json") from exc
         if not isinstance(payload, dict):
@@ -153,15 +166,14 @@ class MediaService:
         token = self._client.get_access_token()
         headers = {"Authorization": f"Bearer {token}"}
         url = f"{self._client.config.base_url}{path}"
-        with httpx.Client(timeout=self._client.config.timeout_seconds) as client:
-            response = client.request(
-                method.upper(),
-                url,
-                headers=headers,
-                params=dict(params or {}),
-                data=dict(form_data or {}),
-                files=files,
-            )
+        response = self._shared_http().request(
+            method.upper(),
+            url,
+            headers=headers,
+            params=dict(params or {}),
+            data=dict(form_data or {}),
+            files=files,
+        )
         if response.status_code >= 400:
             raise HTTPRequestError(
                 f"http request failed: {response.status_code}",
@@ -170,10 +182,31 @@ class MediaService:
             )
         return response
 
+    def _shared_http(self) -> httpx.Client:
+        http = self._http
+        if http is not None:
+            return http
+        with self._http_lock:
+            if self._http is None:
+                config = self._client.config
+                self._http = httpx.Client(
+                    http2=_http2_available(config.http2_enabled),
+                    timeout=config.timeout_seconds,
+                    limits=_build_http_limits(config),
+                )
+            return self._http
+
 
 class AsyncMediaService:
     def __init__(self, feishu_client: AsyncFeishuClient) -> None:
         self._client = feishu_client
+        self._http: Optional[httpx.AsyncClient] = None
+
+    async def aclose(self) -> None:
+        http = self._http
+        self._http = None
+        if http is not None:
+            await http.aclose()
 
     async def upload_image(
         self,
@@ -182,12 +215,12 @@ class AsyncMediaService:
         image_type: str = "message",
     ) -> Mapping[str, Any]:
         filename = os.path.basename(image_path)
-        with open(image_path, "rb") as image_file:
-            return await self.upload_image_bytes(
-                filename,
-                image_file.read(),
-                image_type=image_type,
-            )
+        content = await asyncio.to_thread(read_file_bytes, image_path)
+        return await self.upload_image_bytes(
+            filename,
+            content,
+            image_type=image_type,
+        )
 
     async def upload_image_bytes(
         self,
@@ -218,14 +251,14 @@ class AsyncMediaService:
         content_type: Optional[str] = None,
     ) -> Mapping[str, Any]:
         final_name = file_name or os.path.basename(file_path)
-        with open(file_path, "rb") as file_obj:
-            return await self.upload_file_bytes(
-                final_name,
-                file_obj.read(),
-                file_type=file_type,
-                duration=duration,
-                content_type=content_type,
-            )
+        content = await asyncio.to_thread(read_file_bytes, file_path)
+        return await self.upload_file_bytes(
+            final_name,
+            content,
+            file_type=file_type,
+            duration=duration,
+            content_type=content_type,
+        )
 
     async def upload_file_bytes(
         self,
@@ -284,7 +317,7 @@ class AsyncMediaService:
             params=params,
         )
         try:
-            payload = response.json()
+            payload = json_loads(response.content)
         except ValueError as exc:
             raise HTTPRequestError("response body is not valid json") from exc
         if not isinstance(payload, dict):
@@ -315,15 +348,14 @@ class AsyncMediaService:
         token = await self._client.get_access_token()
         headers = {"Authorization": f"Bearer {token}"}
         url = f"{self._client.config.base_url}{path}"
-        async with httpx.AsyncClient(timeout=self._client.config.timeout_seconds) as client:
-            response = await client.request(
-                method.upper(),
-                url,
-                headers=headers,
-                params=dict(params or {}),
-                data=dict(form_data or {}),
-                files=files,
-            )
+        response = await self._shared_http().request(
+            method.upper(),
+            url,
+            headers=headers,
+            params=dict(params or {}),
+            data=dict(form_data or {}),
+            files=files,
+        )
         if response.status_code >= 400:
             raise HTTPRequestError(
                 f"http request failed: {response.status_code}",
@@ -332,13 +364,25 @@ class AsyncMediaService:
             )
         return response
 
+    def _shared_http(self) -> httpx.AsyncClient:
+        # No await between the check and the assignment, so coroutines on one loop cannot race here.
+        http = self._http
+        if http is None:
+            config = self._client.config
+            http = self._http = httpx.AsyncClient(
+                http2=_http2_available(config.http2_enabled),
+                timeout=config.timeout_seconds,
+                limits=_build_http_limits(config),
+            )
+        return http
+
 
 def _build_file_part(
     filename: str,
     content: bytes,
     content_type: Optional[str],
 ) -> tuple[str, bytes, str]:
-    guessed = content_type or mimetypes.guess_type(filename)[0]
+    guessed = content_type or guess_mime_type(filename)
     return (filename, content, guessed or "application/octet-stream")
 
 
@@ -1,6 +1,9 @@
 import json
 from pathlib import Path
 from typing import Any
+
+import pytest
+
 from feishu_bot_sdk import cli
 
 
@@ -281,6 +284,71 @@ def test_drive_export_shortcut_downloads_ready_file(
     assert (tmp_path / "Weekly Report.pdf").read_bytes() == b"pdf-bytes"
 
 
+@pytest.mark.parametrize(
+    ("attempts", "interval", "expected_sleeps"),
+    [("3", "1", [1.0, 1.0]), ("3", "0", [0.0, 0.0]), ("1", "2", [])],
+)
+def test_drive_export_shortcut_polls_exactly_attempts_times_and_reports_timeout(
+    monkeypatch: Any,
+    capsys: Any,
+    attempts: str,
+    interval: str,
+    expected_sleeps: list[float],
+) -> None:
+    from types import SimpleNamespace
+
+    from feishu_bot_sdk.drive import files as drive_files
+
+    monkeypatch.setenv("FEISHU_APP_ID", "cli_test_app")
+    monkeypatch.setenv("FEISHU_APP_SECRET", "cli_test_secret")
+
+    clock = [0.0]
+    sleeps: list[float] = []
+    polls: list[str] = []
+
+    def _fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+        clock[0] += delay
+
+    def _fake_get_export_task(_self: Any, ticket: str, token: str | None = None) -> dict[str, Any]:
+        polls.append(ticket)
+        return {"result": {"type": "docx", "file_extension": "pdf", "job_status": 2}}
+
+    monkeypatch.setattr(drive_files, "time", SimpleNamespace(monotonic=lambda: clock[0], sleep=_fake_sleep))
+    monkeypatch.setattr(
+        "feishu_bot_sdk.drive.DriveFileService.create_export_task",
+        lambda _self, task: {"ticket": "ticket_3"},
+    )
+    monkeypatch.setattr("feishu_bot_sdk.drive.DriveFileService.get_export_task", _fake_get_export_task)
+
+    code = cli.main(
+        [
+            "drive",
+            "+export",
+            "--token",
+            "doc_1",
+            "--doc-type",
+            "docx",
+            "--file-extension",
+            "pdf",
+            "--poll-attempts",
+            attempts,
+            "--poll-interval",
+            interval,
+            "--format",
+            "json",
+        ]
+    )
+
+    assert code == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["ready"] is False
+    assert payload["failed"] is False
+    assert payload["timed_out"] is True
+    assert len(polls) == int(attempts)
+    assert sleeps == expected_sleeps
+
+
 def test_drive_move_shortcut_defaults_root_and_polls_folder_task(
     monkeypatch: Any,
     capsys: Any,
@@ -15,9 +15,11 @@ def test_media_download_file_writes_bytes(
         assert file_key == "file_1"
         return b"hello-bytes"
 
+    closed: list[MediaService] = []
     monkeypatch.setattr(
         "feishu_bot_sdk.im.media.MediaService.download_file", _fake_download_file
     )
+    monkeypatch.setattr("feishu_bot_sdk.im.media.MediaService.close", lambda self: closed.append(self))
 
     output = tmp_path / "downloads" / "demo.bin"
     code = cli.main(
@@ -37,6 +39,7 @@ def test_media_download_file_writes_bytes(
     assert payload["file_key"] == "file_1"
     assert payload["mode"] == "file"
     assert payload["size"] == 11
+    assert len(closed) == 1
 
 
 def test_media_download_file_image_key_uses_image_endpoint(
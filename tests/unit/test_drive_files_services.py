@@ -1,9 +1,13 @@
 import asyncio
+import json
 from dataclasses import dataclass
 from types import SimpleNamespace
 from typing import Any, Mapping, Optional, cast
 
+import pytest
+
 from feishu_bot_sdk.drive import AsyncDriveFileService, DriveFileService
+from feishu_bot_sdk.exceptions import TaskTimeoutError
 from feishu_bot_sdk.feishu import AsyncFeishuClient, FeishuClient
 
 
@@ -14,6 +18,10 @@ class _DummyResponse:
     content: bytes = b""
     text: str = ""
 
+    def __post_init__(self) -> None:
+        if self.json_data is not None and not self.content:
+            self.content = json.dumps(self.json_data).encode("utf-8")
+
     def json(self) -> Mapping[str, Any]:
         if self.json_data is None:
             raise ValueError("json unavailable")
@@ -392,3 +400,246 @@ def test_drive_iter_files_pagination():
     assert len(stub.calls) == 2
     assert stub.calls[0]["params"] == {"folder_token": "fld_root", "page_size": 1}
     assert stub.calls[1]["params"] == {"folder_token": "fld_root", "page_size": 1, "page_token": "p2"}
+
+
+def test_multipart_body_streams_fields_and_file_with_exact_length():
+    from email.parser import BytesParser
+
+    from feishu_bot_sdk.drive.files import _MultipartBody
+
+    content = b"x" * (70 * 1024)
+    body = _MultipartBody(
+        {"upload_id": "up_1", "seq": "0"},
+        {"file": ('pa"rt.bin', content, "application/octet-stream")},
+    )
+    raw = b"".join(bytes(chunk) for chunk in body)
+
+    assert body.content_length == len(raw)
+    message = BytesParser().parsebytes(f"Content-Type: {body.content_type}\r\n\r\n".encode() + raw)
+    parts = message.get_payload()
+    assert [part.get_param("name", header="content-disposition") for part in parts] == ["upload_id", "seq", "file"]
+    assert parts[0].get_payload() == "up_1"
+    assert parts[2].get_filename() == "pa%22rt.bin"
+    assert parts[2].get_payload(decode=True) == content
+
+
+def test_drive_upload_part_accepts_memoryview_slices_without_copying(monkeypatch: Any):
+    captured: dict[str, Any] = {}
+
+    def fake_request_raw(
+        _self: DriveFileService,
+        method: str,
+        path: str,
+        *,
+        form_data: Optional[Mapping[str, object]] = None,
+        files: Optional[Mapping[str, Any]] = None,
+        params: Optional[Mapping[str, object]] = None,
+    ) -> _DummyResponse:
+        captured["form_data"] = dict(form_data or {})
+        captured["files"] = dict(files or {})
+        return _DummyResponse(json_data={"code": 0, "data": {}})
+
+    monkeypatch.setattr(DriveFileService, "_request_raw", fake_request_raw)
+    service = DriveFileService(cast(FeishuClient, _SyncClientStub(lambda _call: {"code": 0, "data": {}})))
+    payload = bytes(range(256)) * 4
+    part = memoryview(payload)[256:768]
+
+    service.upload_part(upload_id="up_1", seq=1, content=part)
+
+    assert captured["form_data"]["size"] == 512
+    assert captured["files"]["file"][1] is part
+    assert captured["files"]["file"][2] == "application/octet-stream"
+
+
+def test_drive_wait_import_task_backs_off_until_finished(monkeypatch: Any):
+    from feishu_bot_sdk.drive import files as drive_files
+
+    sleeps: list[float] = []
+    monkeypatch.setattr(drive_files.time, "sleep", sleeps.append)
+    statuses = iter([{"job_status": 1}, {"job_status": 2}, {"job_status": 0, "token": "doc_1"}])
+
+    def resolver(_call: Mapping[str, Any]) -> Mapping[str, Any]:
+        return {"code": 0, "data": {"result": next(statuses)}}
+
+    stub = _SyncClientStub(resolver)
+    service = DriveFileService(cast(FeishuClient, stub))
+
+    data = service.wait_import_task("ticket_1", poll_interval=0.2)
+
+    assert data["result"] == {"job_status": 0, "token": "doc_1"}
+    assert len(stub.calls) == 3
+    assert all(call["path"] == "/drive/v1/import_tasks/ticket_1" for call in stub.calls)
+    assert sleeps == [0.2, 0.2 * 1.5]
+
+
+def test_async_drive_wait_export_task_stops_on_failure_status(monkeypatch: Any):
+    from feishu_bot_sdk.drive import files as drive_files
+
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(drive_files.asyncio, "sleep", fake_sleep)
+    statuses = iter([{"job_status": 2}, {"job_status": 110}])
+
+    def resolver(_call: Mapping[str, Any]) -> Mapping[str, Any]:
+        return {"code": 0, "data": {"result": next(statuses)}}
+
+    service = AsyncDriveFileService(cast(AsyncFeishuClient, _AsyncClientStub(resolver)))
+
+    data = asyncio.run(service.wait_export_task("ticket_2", token="doc_1"))
+
+    assert data["result"] == {"job_status": 110}
+    assert sleeps == [0.2]
+    stub = cast(_AsyncClientStub, service._client)
+    assert stub.calls[0]["params"] == {"token": "doc_1"}
+
+
+def test_drive_wait_import_task_raises_with_last_payload_on_timeout(monkeypatch: Any):
+    from feishu_bot_sdk.drive import files as drive_files
+
+    monkeypatch.setattr(drive_files.time, "sleep", lambda _delay: None)
+    completed: list[Mapping[str, Any]] = []
+    stub = _SyncClientStub(lambda _call: {"code": 0, "data": {"result": {"job_status": 2}}})
+    service = DriveFileService(cast(FeishuClient, stub))
+
+    with pytest.raises(TaskTimeoutError) as exc_info:
+        service.wait_import_task("ticket_1", timeout_seconds=0.0, on_complete=completed.append)
+
+    assert exc_info.value.last_payload == {"result": {"job_status": 2}}
+    assert len(stub.calls) == 1
+    assert completed == []
+
+
+def test_drive_wait_import_task_polls_once_more_at_the_deadline(monkeypatch: Any):
+    from feishu_bot_sdk.drive import files as drive_files
+
+    clock = [0.0]
+    sleeps: list[float] = []
+
+    def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+        clock[0] += delay
+
+    monkeypatch.setattr(drive_files, "time", SimpleNamespace(monotonic=lambda: clock[0], sleep=fake_sleep))
+    stub = _SyncClientStub(lambda _call: {"code": 0, "data": {"result": {"job_status": 1}}})
+    service = DriveFileService(cast(FeishuClient, stub))
+
+    with pytest.raises(TaskTimeoutError):
+        service.wait_import_task("ticket_1", poll_interval=2.0, max_poll_interval=2.0, timeout_seconds=3.0)
+
+    assert sleeps == [2.0, 1.0]
+    assert clock[0] == 3.0
+    assert len(stub.calls) == 3
+
+
+@pytest.mark.parametrize(
+    ("result", "finished"),
+    [
+        ({"token": "doc_1"}, True),
+        ({"token": "doc_1", "job_status": "0"}, True),
+        ({"job_status": 0}, False),
+        ({"job_status": 2}, False),
+        ({}, False),
+        ({"job_status": 110}, True),
+    ],
+)
+def test_is_task_finished_treats_present_token_as_done(result: Mapping[str, Any], finished: bool):
+    from feishu_bot_sdk.drive._common import _is_task_finished
+
+    assert _is_task_finished({"result": result}, token_key="token") is finished
+
+
+def test_drive_wait_export_task_calls_on_complete_with_final_payload(monkeypatch: Any):
+    stub = _SyncClientStub(lambda _call: {"code": 0, "data": {"result": {"job_status": 0, "file_token": "box_1"}}})
+    service = DriveFileService(cast(FeishuClient, stub))
+    completed: list[Mapping[str, Any]] = []
+
+    data = service.wait_export_task("ticket_2", on_complete=completed.append)
+
+    assert completed == [data]
+
+
+def test_async_drive_wait_import_task_awaits_on_complete():
+    completed: list[Mapping[str, Any]] = []
+
+    async def on_complete(data: Mapping[str, Any]) -> None:
+        completed.append(data)
+
+    def resolver(_call: Mapping[str, Any]) -> Mapping[str, Any]:
+        return {"code": 0, "data": {"result": {"job_status": 0, "token": "doc_1"}}}
+
+    service = AsyncDriveFileService(cast(AsyncFeishuClient, _AsyncClientStub(resolver)))
+
+    data = asyncio.run(service.wait_import_task("ticket_1", on_complete=on_complete))
+
+    assert completed == [data]
+
+
+def test_async_drive_upload_file_reads_from_worker_thread(monkeypatch: Any, tmp_path: Any):
+    from feishu_bot_sdk.drive import files as drive_files
+
+    file_path = tmp_path / "report.txt"
+    file_path.write_bytes(b"hello")
+    offloaded: list[Any] = []
+    original_to_thread = asyncio.to_thread
+
+    async def fake_to_thread(func: Any, *args: Any) -> Any:
+        offloaded.append(func)
+        return await original_to_thread(func, *args)
+
+    captured: dict[str, Any] = {}
+
+    async def fake_request_raw(
+        _self: AsyncDriveFileService,
+        method: str,
+        path: str,
+        *,
+        form_data: Optional[Mapping[str, object]] = None,
+        files: Optional[Mapping[str, Any]] = None,
+        params: Optional[Mapping[str, object]] = None,
+    ) -> _DummyResponse:
+        captured["form_data"] = dict(form_data or {})
+        captured["files"] = dict(files or {})
+        return _DummyResponse(json_data={"code": 0, "data": {"file_token": "f_1"}})
+
+    monkeypatch.setattr(drive_files.asyncio, "to_thread", fake_to_thread)
+    monkeypatch.setattr(AsyncDriveFileService, "_request_raw", fake_request_raw)
+    service = AsyncDriveFileService(cast(AsyncFeishuClient, _AsyncClientStub(lambda _call: {"code": 0, "data": {}})))
+
+    data = asyncio.run(service.upload_file(str(file_path), parent_type="explorer", parent_node="fld_1"))
+
+    assert data["file_token"] == "f_1"
+    assert offloaded == [drive_files.read_file_bytes]
+    assert captured["form_data"]["file_name"] == "report.txt"
+    assert captured["form_data"]["size"] == 5
+    assert captured["files"]["file"][1] == b"hello"
+
+
+def test_drive_upload_part_sends_precomputed_content_length(monkeypatch: Any):
+    import httpx
+
+    from feishu_bot_sdk.drive import files as drive_files
+
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        request.read()
+        seen.append(request)
+        return httpx.Response(200, json={"code": 0, "data": {}})
+
+    real_client = httpx.Client
+    monkeypatch.setattr(
+        drive_files.httpx,
+        "Client",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    service = DriveFileService(cast(FeishuClient, _SyncClientStub(lambda _call: {"code": 0, "data": {}})))
+
+    service.upload_part(upload_id="up_1", seq=0, content=b"x" * 1000)
+
+    request = seen[0]
+    assert "transfer-encoding" not in request.headers
+    assert int(request.headers["content-length"]) == len(request.content)
+    assert request.headers["authorization"] == "Bearer tenant-token"
@@ -1,9 +1,12 @@
 import asyncio
 from typing import Any, Mapping, Optional, cast
 
+import pytest
+
 from feishu_bot_sdk.drive import AsyncDrivePermissionService, DrivePermissionService
-from feishu_bot_sdk.exceptions import FeishuError
+from feishu_bot_sdk.exceptions import FeishuError, HTTPRequestError
 from feishu_bot_sdk.feishu import AsyncFeishuClient, FeishuClient
+from feishu_bot_sdk.types import DriveResourceType
 
 
 class _SyncClientStub:
@@ -176,3 +179,113 @@ def test_async_permission_service():
     assert stub.calls[0]["method"] == "POST"
     assert stub.calls[1]["method"] == "PUT"
     assert stub.calls[2]["path"] == "/drive/v2/permissions/doc_1/public"
+
+
+def test_async_grant_edit_permissions_bulk_retries_failed_adds_with_update():
+    def resolver(call: Mapping[str, Any]) -> Mapping[str, Any]:
+        if call["method"] == "POST" and call["payload"]["member_id"] in {"ou_2", "ou_3"}:
+            raise FeishuError("already exists")
+        return {"code": 0, "data": {"ok": True}}
+
+    stub = _AsyncClientStub(resolver)
+    service = AsyncDrivePermissionService(cast(AsyncFeishuClient, stub))
+
+    asyncio.run(
+        service.grant_edit_permissions_bulk(
+            "doc_1",
+            ["ou_1", "ou_2", "ou_3"],
+            resource_type="docx",
+            permission="edit",
+            concurrency=2,
+        )
+    )
+
+    assert [call["method"] for call in stub.calls] == ["POST", "POST", "POST", "PUT", "PUT"]
+    assert [call["path"] for call in stub.calls[3:]] == [
+        "/drive/v1/permissions/doc_1/members/ou_2",
+        "/drive/v1/permissions/doc_1/members/ou_3",
+    ]
+
+
+def test_async_grant_edit_permissions_bulk_propagates_update_failure():
+    def resolver(call: Mapping[str, Any]) -> Mapping[str, Any]:
+        raise FeishuError(f"{call['method']} failed")
+
+    service = AsyncDrivePermissionService(cast(AsyncFeishuClient, _AsyncClientStub(resolver)))
+
+    with pytest.raises(FeishuError, match="PUT failed"):
+        asyncio.run(service.grant_edit_permissions_bulk("doc_1", ["ou_1"], resource_type="docx", permission="edit"))
+
+
+def test_resource_params_are_shared_for_known_types_and_built_for_others():
+    def resolver(_call: Mapping[str, Any]) -> Mapping[str, Any]:
+        return {"code": 0, "data": {}}
+
+    stub = _SyncClientStub(resolver)
+    service = DrivePermissionService(cast(FeishuClient, stub))
+
+    service.get_public_settings("doc_1", resource_type=DriveResourceType.DOCX)
+    service.enable_password("doc_1", resource_type="wiki_custom")
+
+    assert stub.calls[0]["params"] == {"type": "docx"}
+    assert stub.calls[1]["params"] == {"type": "wiki_custom"}
+
+
+def test_permission_response_cache_is_opt_in_and_invalidated_by_writes():
+    def resolver(call: Mapping[str, Any]) -> Mapping[str, Any]:
+        return {"code": 0, "data": {"calls": 1}}
+
+    stub = _SyncClientStub(resolver)
+    uncached = DrivePermissionService(cast(FeishuClient, stub))
+    uncached.list_members("doc_1", resource_type="docx")
+    uncached.list_members("doc_1", resource_type="docx")
+    assert len(stub.calls) == 2
+
+    stub = _SyncClientStub(resolver)
+    service = DrivePermissionService(cast(FeishuClient, stub), cache_responses=True)
+    first = service.list_members("doc_1", resource_type="docx")
+    assert service.list_members("doc_1", resource_type="docx") is first
+    service.list_members("doc_1", resource_type="docx", fields="perm")
+    service.get_public_settings("doc_2", resource_type="docx")
+    assert len(stub.calls) == 3
+
+    service.add_member("doc_1", resource_type="docx", member_id="ou_1", perm="view")
+    service.list_members("doc_1", resource_type="docx")
+    service.get_public_settings("doc_2", resource_type="docx")
+    assert [call["method"] for call in stub.calls[3:]] == ["POST", "GET"]
+
+
+def test_async_permission_response_cache_does_not_serve_expired_entry_on_http_error(monkeypatch: pytest.MonkeyPatch):
+    from feishu_bot_sdk.drive import _common
+
+    now = [100.0]
+    monkeypatch.setattr(_common.time, "monotonic", lambda: now[0])
+    failing = [False]
+
+    def resolver(_call: Mapping[str, Any]) -> Mapping[str, Any]:
+        if failing[0]:
+            raise HTTPRequestError("http request failed: 503", status_code=503)
+        return {"code": 0, "data": {"allowed": True}}
+
+    stub = _AsyncClientStub(resolver)
+    service = AsyncDrivePermissionService(cast(AsyncFeishuClient, stub), cache_responses=True)
+
+    async def run() -> Mapping[str, Any]:
+        await service.check_member_permission("doc_1", resource_type="docx", action="edit")
+        now[0] += 60.0
+        failing[0] = True
+        return await service.check_member_permission("doc_1", resource_type="docx", action="edit")
+
+    with pytest.raises(HTTPRequestError):
+        asyncio.run(run())
+
+    assert len(stub.calls) == 2
+
+
+def test_member_type_accepts_enum_members_and_defaults_to_openid():
+    from feishu_bot_sdk.drive.permissions import _member_type
+    from feishu_bot_sdk.types import MemberIdType
+
+    assert _member_type(MemberIdType.USER_ID) == "userid"
+    assert _member_type("union_id") == "unionid"
+    assert _member_type("email") == "openid"
@@ -0,0 +1,62 @@
+import asyncio
+from typing import Any
+
+from feishu_bot_sdk.events import idempotency
+from feishu_bot_sdk.events.idempotency import AsyncMemoryIdempotencyStore, MemoryIdempotencyStore
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def test_memory_store_cleanup_drops_only_expired_keys(monkeypatch: Any):
+    clock = _Clock()
+    monkeypatch.setattr(idempotency.time, "monotonic", clock.monotonic)
+    store = MemoryIdempotencyStore(cleanup_interval_seconds=0.0)
+
+    assert store.mark_once("short", ttl_seconds=10.0) is True
+    assert store.mark_once("long", ttl_seconds=100.0) is True
+    assert store.mark_once("short", ttl_seconds=10.0) is False
+
+    clock.now += 50.0
+    assert store.seen("short") is False
+    assert store._data == {"long": 1_100.0}
+    assert store.mark_once("short", ttl_seconds=100.0) is True
+
+    clock.now += 60.0
+    assert store.seen("long") is False
+    assert store.seen("short") is True
+    assert list(store._data) == ["short"]
+
+
+def test_memory_store_remark_after_delete_keeps_new_expiry(monkeypatch: Any):
+    clock = _Clock()
+    monkeypatch.setattr(idempotency.time, "monotonic", clock.monotonic)
+    store = MemoryIdempotencyStore(cleanup_interval_seconds=0.0)
+
+    store.mark_once("evt", ttl_seconds=10.0)
+    store.delete("evt")
+    store.mark_once("evt", ttl_seconds=100.0)
+
+    clock.now += 20.0
+    assert store.seen("evt") is True
+
+
+def test_async_memory_store_cleanup_drops_expired_keys(monkeypatch: Any):
+    clock = _Clock()
+    monkeypatch.setattr(idempotency.time, "monotonic", clock.monotonic)
+    store = AsyncMemoryIdempotencyStore(cleanup_interval_seconds=0.0)
+
+    async def run() -> None:
+        assert await store.mark_once("evt_1", ttl_seconds=5.0) is True
+        assert await store.mark_once("evt_2", ttl_seconds=50.0) is True
+        clock.now += 10.0
+        assert await store.mark_once("evt_1", ttl_seconds=5.0) is True
+        assert await store.mark_once("evt_2", ttl_seconds=50.0) is False
+
+    asyncio.run(run())
+    assert set(store._data) == {"evt_1", "evt_2"}
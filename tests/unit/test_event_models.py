@@ -1,4 +1,8 @@
 import asyncio
+import functools
+import sys
+
+import pytest
 
 from feishu_bot_sdk import FeishuEventRegistry, build_event_context
 from feishu_bot_sdk.events import (
@@ -18,6 +22,7 @@ from feishu_bot_sdk.events import (
     TextMessageContent,
     UnknownMessageContent,
     parse_received_message_content,
+    parse_received_message_content_batch,
 )
 
 
@@ -155,6 +160,29 @@ def test_registry_dispatches_bitable_events_with_typed_models():
     assert captured == ["record:tbl_record", "field:tbl_field"]
 
 
+def test_registry_on_typed_registers_known_event_models():
+    captured: list[object] = []
+    registry = FeishuEventRegistry()
+    registry.on_typed("drive.file.bitable_record_changed_v1", captured.append)
+
+    registry.dispatch(
+        build_event_context(
+            {
+                "schema": "2.0",
+                "header": {
+                    "event_id": "evt_record_typed",
+                    "event_type": "drive.file.bitable_record_changed_v1",
+                },
+                "event": {"table_id": "tbl_record"},
+            }
+        )
+    )
+
+    assert isinstance(captured[0], P2DriveFileBitableRecordChangedV1)
+    with pytest.raises(ValueError):
+        registry.on_typed("custom.event", captured.append)
+
+
 def test_registry_adispatches_bitable_event():
     async def run() -> None:
         registry = FeishuEventRegistry()
@@ -463,6 +491,26 @@ def test_parse_received_message_content_for_common_types():
     assert merge_forward.content == "Merged and Forwarded Message"
 
 
+def test_parse_received_message_content_batch_matches_single_parse():
+    items = [
+        ("text", '{"text":"a"}'),
+        (" TEXT ", '{"text":"b"}'),
+        ("image", '{"image_key":"img_1"}'),
+        ("text", "{invalid-json"),
+        ("custom_type", '{"x":1}'),
+    ]
+
+    batch = parse_received_message_content_batch(items)
+
+    assert batch == [
+        parse_received_message_content(message_type=message_type, content_raw=content_raw)
+        for message_type, content_raw in items
+    ]
+    assert batch[1].message_type == "text"
+    assert isinstance(batch[3], UnknownMessageContent)
+    assert batch[4].message_type == "custom_type"
+
+
 def test_parse_received_message_content_returns_unknown_for_invalid_payload():
     parsed = parse_received_message_content(
         message_type="text",
@@ -513,3 +561,164 @@ def test_im_message_receive_model_parses_typed_content():
     assert model.content.text == "hello event"
     assert model.content_raw == '{"text":"hello event"}'
     assert model.text == "hello event"
+
+
+def test_registry_unregister_falls_back_to_default_handler():
+    registry = FeishuEventRegistry()
+    registry.register("im.message.read_v1", lambda _ctx: "specific")
+    registry.register_default(lambda _ctx: "default")
+    context = build_event_context(
+        {
+            "schema": "2.0",
+            "header": {"event_id": "evt_unregister", "event_type": "im.message.read_v1"},
+            "event": {},
+        }
+    )
+
+    assert registry.dispatch(context) == "specific"
+    registry.unregister("im.message.read_v1")
+    registry.unregister("im.message.read_v1")
+    assert registry.dispatch(context) == "default"
+
+
+def test_is_async_handler_memoizes_and_handles_unweakrefable_callables():
+    from feishu_bot_sdk.events import handlers as event_handlers
+    from feishu_bot_sdk.events import is_async_handler
+
+    async def handle(_ctx: object) -> None:
+        return None
+
+    assert is_async_handler(handle) is True
+    assert event_handlers._ASYNC_HANDLER_CACHE[handle] is True
+    assert is_async_handler(print) is False
+
+
+def test_is_async_handler_detects_partials_and_async_callable_objects():
+    from feishu_bot_sdk.events import is_async_handler
+
+    async def handle(_ctx: object, _suffix: str) -> None:
+        return None
+
+    class _AsyncCallable:
+        async def __call__(self, _ctx: object) -> None:
+            return None
+
+    class _SyncCallable:
+        def __call__(self, _ctx: object) -> None:
+            return None
+
+    assert is_async_handler(functools.partial(handle, _suffix="x")) is True
+    assert is_async_handler(_AsyncCallable()) is True
+    assert is_async_handler(_SyncCallable()) is False
+
+
+def test_registry_dispatch_batch_keeps_delivery_order():
+    registry = FeishuEventRegistry()
+    registry.on_bitable_record_changed(lambda event: f"record:{event.table_id}")
+    registry.on_bitable_field_changed(lambda event: f"field:{event.table_id}")
+
+    def _context(event_type: str, table_id: str):
+        return build_event_context(
+            {
+                "schema": "2.0",
+                "header": {"event_id": f"evt_{table_id}", "event_type": event_type},
+                "event": {"table_id": table_id},
+            }
+        )
+
+    contexts = [
+        _context("drive.file.bitable_record_changed_v1", "t1"),
+        _context("drive.file.bitable_field_changed_v1", "t2"),
+        _context("drive.file.bitable_record_changed_v1", "t3"),
+    ]
+
+    assert registry.dispatch_batch(contexts) == ["record:t1", "field:t2", "record:t3"]
+
+    async def _async_record(event: P2DriveFileBitableRecordChangedV1) -> str:
+        return f"async:{event.table_id}"
+
+    registry.on_bitable_record_changed(_async_record)
+    assert asyncio.run(registry.adispatch_batch(contexts)) == ["async:t1", "field:t2", "async:t3"]
+    with pytest.raises(RuntimeError):
+        registry.dispatch_batch(contexts)
+
+
+def test_registry_interns_registered_event_types():
+    registry = FeishuEventRegistry()
+    event_type = "".join(["im.message.", "read_v1"])
+
+    registry.register(event_type, lambda ctx: None)
+
+    (registered,) = registry._handlers
+    assert registered is sys.intern("im.message.read_v1")
+
+
+def test_build_event_context_shares_one_payload_copy():
+    payload = {
+        "schema": "2.0",
+        "header": {"event_id": "evt_copy", "event_type": "im.message.read_v1"},
+        "event": {"reader": {}},
+    }
+
+    context = build_event_context(payload)
+
+    assert context.payload == payload
+    assert context.payload is not payload
+    assert context.payload is context.envelope.raw
+
+
+def test_event_envelope_is_slotted_and_interns_event_type():
+    event_type = "".join(["im.message.", "read_v1"])
+    context = build_event_context(
+        {
+            "schema": "2.0",
+            "header": {"event_id": "evt_slots", "event_type": event_type},
+            "event": {},
+        }
+    )
+
+    assert not hasattr(context, "__dict__")
+    assert not hasattr(context.envelope, "__dict__")
+    assert context.envelope.event_type is sys.intern("im.message.read_v1")
+
+
+def test_parsed_message_content_is_slotted_dataclass():
+    import dataclasses
+
+    parsed = parse_received_message_content(message_type="text", content_raw='{"text":"hi"}')
+
+    assert dataclasses.is_dataclass(parsed)
+    assert not hasattr(parsed, "__dict__")
+    assert dataclasses.replace(parsed, text="bye").text == "bye"
+
+
+def test_parse_received_message_content_normalizes_type_on_table_miss():
+    parsed = parse_received_message_content(message_type=" Share_Calendar_Event ", content_raw='{"summary":"sync"}')
+
+    assert isinstance(parsed, CalendarMessageContent)
+    assert parsed.message_type == "share_calendar_event"
+    assert parsed.summary == "sync"
+
+
+def test_typed_event_models_share_the_context_payload_as_raw():
+    context = build_event_context(
+        {
+            "schema": "2.0",
+            "header": {"event_id": "evt_raw", "event_type": "im.message.read_v1"},
+            "event": {"reader": {"reader_id": {"open_id": "ou_1"}}},
+        }
+    )
+
+    event = P2ImMessageReadV1.from_context(context)
+
+    assert event.raw is context.payload
+    assert event.raw["header"]["event_id"] == "evt_raw"
+
+
+def test_parse_received_message_content_uses_canonical_type_strings():
+    message_type = "".join(["general_", "calendar"])
+
+    parsed = parse_received_message_content(message_type=message_type, content_raw="{}")
+
+    assert isinstance(parsed, CalendarMessageContent)
+    assert parsed.message_type is sys.intern("general_calendar")
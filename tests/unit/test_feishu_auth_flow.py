@@ -1,9 +1,20 @@
 import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, cast
 
+import pytest
+
 from feishu_bot_sdk.config import FeishuConfig
 from feishu_bot_sdk.exceptions import FeishuError, HTTPRequestError
-from feishu_bot_sdk.feishu import AsyncFeishuClient, FeishuClient, _initial_user_token_cache
+from feishu_bot_sdk.feishu import (
+    AsyncFeishuClient,
+    FeishuClient,
+    OAuthUserToken,
+    _initial_user_token_cache,
+    _text_content,
+)
 from feishu_bot_sdk.http_client import AsyncJsonHttpClient, JsonHttpClient
 
 
@@ -453,6 +464,61 @@ def test_request_json_uses_openapi_root_for_full_openapi_paths_and_keeps_delete_
     assert call["payload"] is None
 
 
+def test_request_json_reuses_prepared_request_and_headers_per_method() -> None:
+    http = _CaptureHttpClient()
+    client = FeishuClient(
+        FeishuConfig(
+            auth_mode="tenant",
+            access_token="tenant-token",
+        ),
+        http_client=cast(JsonHttpClient, http),
+    )
+
+    client.request_json("post", "/im/v1/messages", payload={"receive_id": "ou_1"})
+    client.request_json("POST", "/im/v1/messages", payload={"receive_id": "ou_2"})
+    client.request_json("GET", "/im/v1/messages", params={"page_size": 1})
+
+    first, second, third = http.calls
+    assert first["method"] == second["method"] == "POST"
+    assert first["url"] == second["url"] == "https://open.feishu.cn/open-apis/im/v1/messages"
+    assert first["headers"] == {"Authorization": "Bearer tenant-token", "Content-Type": "application/json"}
+    assert first["headers"] is second["headers"]
+    assert third["headers"] == {"Authorization": "Bearer tenant-token"}
+    assert first["payload"] == {"receive_id": "ou_1"}
+    assert second["payload"] == {"receive_id": "ou_2"}
+
+
+def test_prepare_request_memoizes_only_method_and_base_url() -> None:
+    from feishu_bot_sdk import feishu
+
+    feishu._openapi_roots.cache_clear()
+    for index in range(50):
+        method, url, key = feishu._prepare_request("get", "https://open.feishu.cn/open-apis/", f"/im/v1/messages/om_{index}")
+        assert method == "GET"
+        assert url == f"https://open.feishu.cn/open-apis/im/v1/messages/om_{index}"
+        assert key == f"GET:/im/v1/messages/om_{index}"
+
+    assert not hasattr(feishu._prepare_request, "cache_info")
+    assert feishu._openapi_roots.cache_info().currsize == 1
+
+
+def test_authorization_headers_are_cached_per_client_and_dropped_on_token_refresh() -> None:
+    config = FeishuConfig(auth_mode="tenant", access_token="tenant-token")
+    client = FeishuClient(config, http_client=cast(JsonHttpClient, _CaptureHttpClient()))
+    other = FeishuClient(config, http_client=cast(JsonHttpClient, _CaptureHttpClient()))
+
+    json_headers = client._authorization_headers("tok-1", True)
+
+    assert client._authorization_headers("tok-1", True) is json_headers
+    assert client._authorization_headers("tok-1", False) == {"Authorization": "Bearer tok-1"}
+    assert other._authorization_headers("tok-1", True) is not json_headers
+
+    client._update_user_token_cache(OAuthUserToken(access_token="user-2", token_type="Bearer", expires_in=7200))
+
+    assert "tok-1" not in client._auth_headers
+    assert client._authorization_headers("tok-1", True) == json_headers
+
+
 def test_request_multipart_uses_openapi_root_and_omits_json_content_type() -> None:
     http = _CaptureHttpClient()
     client = FeishuClient(
@@ -576,3 +642,140 @@ def test_async_request_json_does_not_refresh_on_business_object_token_error() ->
     asyncio.run(run())
 
     assert [call["url"].split("/open-apis")[-1] for call in http.calls] == ["/docs/v1/content"]
+
+
+class _AsyncTenantTokenHttpClient:
+    def __init__(self) -> None:
+        self.token_fetches = 0
+
+    async def request_json(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        params: dict[str, object] | None = None,
+        payload: dict[str, object] | None = None,
+        timeout_seconds: float | None = None,
+    ) -> dict[str, Any]:
+        del method, headers, params, payload, timeout_seconds
+        assert url.endswith("/auth/v3/tenant_access_token/internal")
+        self.token_fetches += 1
+        await asyncio.sleep(0)
+        return {"code": 0, "tenant_access_token": "tenant-token", "expire": 7200}
+
+
+def test_async_concurrent_token_resolution_refreshes_once() -> None:
+    http = _AsyncTenantTokenHttpClient()
+    client = AsyncFeishuClient(
+        FeishuConfig(app_id="cli_test", app_secret="secret"),
+        http_client=cast(AsyncJsonHttpClient, http),
+    )
+
+    async def run() -> list[str]:
+        return list(await asyncio.gather(*(client.get_access_token() for _ in range(16))))
+
+    tokens = asyncio.run(run())
+
+    assert tokens == ["tenant-token"] * 16
+    assert http.token_fetches == 1
+
+
+class _SlowTenantTokenHttpClient:
+    def __init__(self) -> None:
+        self.token_fetches = 0
+
+    def request_json(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        params: dict[str, object] | None = None,
+        payload: dict[str, object] | None = None,
+        timeout_seconds: float | None = None,
+    ) -> dict[str, Any]:
+        del method, headers, params, payload, timeout_seconds
+        assert url.endswith("/auth/v3/tenant_access_token/internal")
+        self.token_fetches += 1
+        time.sleep(0.05)
+        return {"code": 0, "tenant_access_token": "tenant-token", "expire": 7200}
+
+
+def test_concurrent_token_resolution_refreshes_once() -> None:
+    http = _SlowTenantTokenHttpClient()
+    client = FeishuClient(
+        FeishuConfig(app_id="cli_test", app_secret="secret"),
+        http_client=cast(JsonHttpClient, http),
+    )
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        tokens = list(pool.map(lambda _: client.get_access_token(), range(16)))
+
+    assert tokens == ["tenant-token"] * 16
+    assert http.token_fetches == 1
+
+
+def test_send_text_message_encodes_text_content() -> None:
+    http = _CaptureHttpClient()
+    client = FeishuClient(
+        FeishuConfig(
+            auth_mode="tenant",
+            access_token="tenant-token",
+        ),
+        http_client=cast(JsonHttpClient, http),
+    )
+
+    client.send_text_message("ou_1", "open_id", 'say "你好"\n')
+
+    payload = http.calls[0]["payload"]
+    assert payload["msg_type"] == "text"
+    assert json.loads(payload["content"]) == {"text": 'say "你好"\n'}
+    assert "你好" in payload["content"]
+
+
+def test_async_send_text_message_posts_to_messages_endpoint() -> None:
+    http = _AsyncCaptureHttpClient()
+    client = AsyncFeishuClient(
+        FeishuConfig(
+            auth_mode="tenant",
+            access_token="tenant-token",
+        ),
+        http_client=cast(AsyncJsonHttpClient, http),
+    )
+
+    asyncio.run(client.send_text_message("oc_1", "chat_id", "hello"))
+
+    (call,) = http.calls
+    assert call["method"] == "POST"
+    assert call["url"] == "https://open.feishu.cn/open-apis/im/v1/messages"
+    assert call["params"] == {"receive_id_type": "chat_id"}
+    assert call["headers"]["Content-Type"] == "application/json"
+    assert json.loads(call["payload"]["content"]) == {"text": "hello"}
+
+
+def test_build_authorize_url_uses_open_domain_root() -> None:
+    client = FeishuClient(FeishuConfig(app_id="cli_test", app_secret="secret"))
+
+    url = client.build_authorize_url(redirect_uri="https://example.com/cb", state="s1")
+
+    assert url == (
+        "https://open.feishu.cn/open-apis/authen/v1/authorize"
+        "?app_id=cli_test&response_type=code&redirect_uri=https%3A%2F%2Fexample.com%2Fcb&state=s1"
+    )
+
+
+@pytest.mark.parametrize("text", ["hello", "你好 😀", 'say "hi"', "back\\slash", "line\nbreak", "tab\t", ""])
+def test_text_content_matches_json_encoding(text: str) -> None:
+    assert _text_content(text) == json.dumps({"text": text}, ensure_ascii=False, separators=(",", ":"))
+
+
+def test_default_http_client_keeps_pooled_connections_alive_and_closes() -> None:
+    client = FeishuClient(FeishuConfig(app_id="cli_test", app_secret="secret", http_keepalive_expiry_seconds=45.0))
+    session = cast(Any, client._http)._session
+
+    assert session._transport._pool._keepalive_expiry == 45.0
+
+    client.close()
+
+    assert session.is_closed
@@ -1,4 +1,5 @@
 import asyncio
+import json
 from typing import Any, cast
 
 import httpx
@@ -13,6 +14,7 @@ class _Response:
         self.status_code = status_code
         self._payload = payload or {"ok": True}
         self.text = "{}"
+        self.content = json.dumps(self._payload).encode("utf-8")
         self.headers: dict[str, str] = {}
 
     def json(self) -> dict[str, Any]:
@@ -135,3 +137,59 @@ def test_async_json_http_client_wraps_httpx_timeout_as_request_error() -> None:
             await client.request_json("GET", "https://example.com/slow")
 
     asyncio.run(run())
+
+
+def test_json_http_client_falls_back_to_http1_without_h2(monkeypatch: pytest.MonkeyPatch) -> None:
+    from feishu_bot_sdk import http_client
+
+    monkeypatch.setattr(http_client, "h2", None)
+
+    assert http_client._http2_available(True) is False
+    assert http_client._http2_available(False) is False
+
+
+def test_json_http_client_applies_connection_pool_limits() -> None:
+    limits = httpx.Limits(max_connections=7, max_keepalive_connections=3)
+
+    client = JsonHttpClient(limits=limits)
+
+    pool = client._session._transport._pool  # type: ignore[attr-defined]
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 3
+
+
+def test_json_http_client_error_exposes_response_headers() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, headers={"Retry-After": "3"}, text="slow down")
+
+    client = JsonHttpClient(session=httpx.Client(transport=httpx.MockTransport(handler)))
+
+    with pytest.raises(HTTPRequestError) as exc_info:
+        client.request_json("GET", "https://example.com/api")
+
+    headers = exc_info.value.response_headers
+    assert headers["retry-after"] == "3"
+    assert exc_info.value.response_headers is headers
+    assert HTTPRequestError("no headers").response_headers == {}
+
+
+def test_json_http_client_close_releases_session() -> None:
+    session = httpx.Client()
+    client = JsonHttpClient(session=session)
+
+    client.close()
+
+    assert session.is_closed
+
+
+def test_json_http_client_decodes_raw_body_and_rejects_invalid_json() -> None:
+    bodies = iter([b'{"text": "\xe4\xbd\xa0\xe5\xa5\xbd"}', b"not json"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=next(bodies))
+
+    client = JsonHttpClient(session=httpx.Client(transport=httpx.MockTransport(handler)))
+
+    assert client.request_json("GET", "https://example.com/api") == {"text": "你好"}
+    with pytest.raises(HTTPRequestError, match="not valid json"):
+        client.request_json("GET", "https://example.com/api")
@@ -1,8 +1,14 @@
 import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from types import SimpleNamespace
 from typing import Any, Mapping, Optional, cast
 
+import httpx
+
+from feishu_bot_sdk.config import FeishuConfig
 from feishu_bot_sdk.feishu import AsyncFeishuClient, FeishuClient
 from feishu_bot_sdk.im.content import MessageContent
 from feishu_bot_sdk.im.media import AsyncMediaService, MediaService
@@ -16,6 +22,10 @@ class _DummyResponse:
     content: bytes = b""
     text: str = ""
 
+    def __post_init__(self) -> None:
+        if self.json_data is not None and not self.content:
+            self.content = json.dumps(self.json_data).encode("utf-8")
+
     def json(self) -> Mapping[str, Any]:
         if self.json_data is None:
             raise ValueError("json unavailable")
@@ -472,6 +482,94 @@ def test_media_download_message_resource_uses_query(monkeypatch: Any):
     assert captured["params"] == {"type": "file"}
 
 
+def test_media_service_reuses_pooled_http_client_until_closed(monkeypatch: Any):
+    created: list[httpx.Client] = []
+    real_client = httpx.Client
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"file-bytes")
+
+    def build_client(**kwargs: Any) -> httpx.Client:
+        client = real_client(transport=httpx.MockTransport(handler), **kwargs)
+        created.append(client)
+        return client
+
+    monkeypatch.setattr("feishu_bot_sdk.im.media.httpx.Client", build_client)
+    feishu_client = SimpleNamespace(
+        config=FeishuConfig(app_id="cli_test", app_secret="secret"),
+        get_access_token=lambda: "t-1",
+    )
+    service = MediaService(cast(FeishuClient, feishu_client))
+
+    assert service.download_message_resource("om_1", "file_1", resource_type="file") == b"file-bytes"
+    assert service.download_message_resource("om_1", "file_2", resource_type="file") == b"file-bytes"
+    assert len(created) == 1
+
+    service.close()
+
+    assert created[0].is_closed
+
+
+def test_async_media_service_aclose_releases_pooled_client(monkeypatch: Any):
+    created: list[httpx.AsyncClient] = []
+    real_client = httpx.AsyncClient
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"file-bytes")
+
+    def build_client(**kwargs: Any) -> httpx.AsyncClient:
+        client = real_client(transport=httpx.MockTransport(handler), **kwargs)
+        created.append(client)
+        return client
+
+    async def get_access_token() -> str:
+        return "t-1"
+
+    monkeypatch.setattr("feishu_bot_sdk.im.media.httpx.AsyncClient", build_client)
+    feishu_client = SimpleNamespace(
+        config=FeishuConfig(app_id="cli_test", app_secret="secret"),
+        get_access_token=get_access_token,
+    )
+    service = AsyncMediaService(cast(AsyncFeishuClient, feishu_client))
+
+    async def run() -> None:
+        await service.download_message_resource("om_1", "file_1", resource_type="file")
+        await service.download_message_resource("om_1", "file_2", resource_type="file")
+        await service.aclose()
+        await service.aclose()
+
+    asyncio.run(run())
+
+    assert len(created) == 1
+    assert created[0].is_closed
+    assert service._http is None
+
+
+def test_media_service_builds_one_shared_client_across_threads(monkeypatch: Any):
+    created: list[dict[str, Any]] = []
+    barrier = threading.Barrier(8)
+
+    def build_client(**kwargs: Any) -> object:
+        created.append(kwargs)
+        return object()
+
+    monkeypatch.setattr("feishu_bot_sdk.im.media.httpx.Client", build_client)
+    monkeypatch.setattr("feishu_bot_sdk.im.media._http2_available", lambda enabled: enabled)
+    config = FeishuConfig(app_id="cli_test", app_secret="secret", http2_enabled=True)
+    service = MediaService(cast(FeishuClient, SimpleNamespace(config=config)))
+
+    def shared() -> object:
+        barrier.wait()
+        return service._shared_http()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        clients = list(pool.map(lambda _i: shared(), range(8)))
+
+    assert len(created) == 1
+    assert all(client is clients[0] for client in clients)
+    assert created[0]["http2"] is True
+
+
 def test_async_message_reply_text():
     async def run() -> None:
         stub = _AsyncClientStub()
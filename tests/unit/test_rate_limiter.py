@@ -5,7 +5,7 @@ import pytest
 
 from feishu_bot_sdk.config import FeishuConfig
 from feishu_bot_sdk.exceptions import HTTPRequestError
-from feishu_bot_sdk.feishu import AsyncFeishuClient, FeishuClient
+from feishu_bot_sdk.feishu import AsyncFeishuClient, FeishuClient, _extract_retry_after, _is_throttled_response
 from feishu_bot_sdk.http_client import AsyncJsonHttpClient, JsonHttpClient
 from feishu_bot_sdk.rate_limit import AdaptiveRateLimiter, AsyncAdaptiveRateLimiter, RateLimitTuning
 
@@ -173,6 +173,37 @@ def test_feishu_client_throttles_on_http_429():
     assert limiter.throttled == [("POST:/im/v1/messages", 3.0)]
 
 
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({"retry-after": "2.5"}, 2.5),
+        ({"Retry-After": "3"}, 3.0),
+        ({"RETRY-AFTER": "4"}, 4.0),
+        ({"retry-after": " "}, None),
+        ({"retry-after": "soon"}, None),
+        ({"retry-after": "0"}, None),
+        ({"content-type": "application/json"}, None),
+    ],
+)
+def test_extract_retry_after_handles_header_casing(headers: Mapping[str, str], expected: Optional[float]):
+    assert _extract_retry_after(headers) == expected
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        ({"code": 99991663, "msg": "ok"}, True),
+        ({"code": 1, "msg": "Request FREQUENCY limit exceeded"}, True),
+        ({"code": 1, "msg": "Too Many Requests"}, True),
+        ({"code": 1, "msg": "hit rate limit"}, True),
+        ({"code": 1, "msg": "permission denied"}, False),
+        ({"code": 1}, False),
+    ],
+)
+def test_is_throttled_response_matches_codes_and_messages(data: Mapping[str, object], expected: bool):
+    assert _is_throttled_response(data) is expected
+
+
 def test_feishu_client_auto_mode_retries_with_user_when_tenant_requires_user_identity():
     calls: list[Mapping[str, Any]] = []
 
@@ -197,7 +228,7 @@ def test_feishu_client_auto_mode_retries_with_user_when_tenant_requires_user_ide
         ),
         http_client=cast(JsonHttpClient, http),
     )
-    client._tenant_token_cache = cast(Any, type("Cache", (), {"token": "tenant-token", "expires_at": float("inf")})())
+    client._tenant_token_cache = cast(Any, type("Cache", (), {"token": "tenant-token", "refresh_at": float("inf")})())
 
     data = client.request_json("POST", "/wiki/v2/spaces", payload={"name": "Test"})
 
@@ -229,7 +260,7 @@ def test_feishu_client_auto_mode_retries_with_tenant_when_endpoint_rejects_user_
         ),
         http_client=cast(JsonHttpClient, http),
     )
-    client._tenant_token_cache = cast(Any, type("Cache", (), {"token": "tenant-token", "expires_at": float("inf")})())
+    client._tenant_token_cache = cast(Any, type("Cache", (), {"token": "tenant-token", "refresh_at": float("inf")})())
 
     data = client.request_json("POST", "/calendar/v4/calendars/primary/events", payload={"summary": "Meeting"})
 
@@ -314,7 +345,7 @@ def test_async_feishu_client_auto_mode_retries_with_user_when_tenant_requires_us
             ),
             http_client=cast(AsyncJsonHttpClient, http),
         )
-        client._tenant_token_cache = cast(Any, type("Cache", (), {"token": "tenant-token", "expires_at": float("inf")})())
+        client._tenant_token_cache = cast(Any, type("Cache", (), {"token": "tenant-token", "refresh_at": float("inf")})())
 
         data = await client.request_json("POST", "/drive/v1/files", payload={"page_size": 10})
         assert data == {"code": 0, "data": {"ok": True, "mode": "user"}}